@@ -1,9 +1,14 @@
 import sys
+import time
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import fields
 from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
-import boto3  # Keep boto3 import for potential direct use or error handling types
+import boto3
 import pandas as pd
 import streamlit as st
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
@@ -25,15 +30,77 @@ load_dotenv()
 S3_BUCKET_NAME = config.s3_bucket_name
 DYNAMODB_TABLE_NAME = config.dynamodb_table_name
 AWS_REGION = config.aws_region
+# Optional GSI for listing items with a Query; falls back to a Scan when unset
+ADMIN_INDEX_NAME = config.dynamodb_admin_index_name
+
+# Shared botocore config for the admin clients: the detail views issue several
+# concurrent requests, so raise the default pool of 10 and keep connections alive
+BOTOCORE_CONFIG = Config(
+    max_pool_connections=50,
+    retries={"max_attempts": 5, "mode": "adaptive"},
+    tcp_keepalive=True,
+)
+
+# Markdown larger than this is previewed with a ranged GET until fully requested
+MARKDOWN_PREVIEW_BYTES = 256 * 1024
+
+# Define preferred display order for columns
+PREFERRED_COLUMN_ORDER = [
+    "guid",
+    "published_date",
+    "title",
+    "md_path",
+    "source_url",
+    "fetch_date",
+    "summary_path",
+    "last_updated",
+    # Add other columns in your preferred order
+]
+
+# Fields that are never shown in the items table: in-memory content fields are not
+# stored in DynamoDB, and the newsletters list and bookkeeping hashes are only shown
+# in the JSON details
+HIDDEN_COLUMNS = {
+    "html_content",
+    "markdown_content",
+    "summary",
+    "short_summary",
+    "newsletters",
+    "to_be_summarized_hash",
+}
+
+# Columns with few distinct values (feeds and quality flags), stored as categoricals
+CATEGORY_COLUMNS = {"source_url", "is_paywall", "to_be_summarized"}
+
+# Get field names from ContentItem dataclass
+CONTENT_ITEM_FIELDS = [field.name for field in fields(ContentItem)]
+
+# Columns shown in the items table (and the only attributes projected by the scan):
+# preferred order first, then any remaining ContentItem fields
+DISPLAY_COLUMNS = [col for col in PREFERRED_COLUMN_ORDER if col in CONTENT_ITEM_FIELDS]
+DISPLAY_COLUMNS.extend(
+    field
+    for field in CONTENT_ITEM_FIELDS
+    if field not in DISPLAY_COLUMNS and field not in HIDDEN_COLUMNS
+)
 
 
 # Initialize services using Streamlit's caching for efficiency
+@st.cache_resource
+def get_boto3_session():
+    """Cached boto3 session shared by the AWS clients (one credential lookup)."""
+    return boto3.Session(region_name=AWS_REGION)
+
+
 @st.cache_resource
 def get_dynamodb_state():
     """Cached function to get DynamoDBState instance."""
     try:
         return DynamoDBState(
-            dynamodb_table_name=DYNAMODB_TABLE_NAME, aws_region=AWS_REGION
+            dynamodb_table_name=DYNAMODB_TABLE_NAME,
+            aws_region=AWS_REGION,
+            botocore_config=BOTOCORE_CONFIG,
+            session=get_boto3_session(),
         )
     except Exception as e:
         st.error(f"Failed to initialize DynamoDBState: {e}")
@@ -44,7 +111,12 @@ def get_dynamodb_state():
 def get_s3_storage():
     """Cached function to get S3Storage instance."""
     try:
-        return S3Storage(s3_bucket_name=S3_BUCKET_NAME, aws_region=AWS_REGION)
+        return S3Storage(
+            s3_bucket_name=S3_BUCKET_NAME,
+            aws_region=AWS_REGION,
+            botocore_config=BOTOCORE_CONFIG,
+            session=get_boto3_session(),
+        )
     except Exception as e:
         st.error(f"Failed to initialize S3Storage: {e}")
         return None
@@ -62,181 +134,288 @@ if not state_manager or not s3_storage:
 
 # --- Data Fetching ---
 # Cache the data fetching function to avoid reloading on every interaction
-@st.cache_data(ttl=120)  # Cache data for 120 seconds
-def fetch_all_metadata(_state_manager: DynamoDBState):
-    """Fetches all metadata items using a DynamoDB scan."""
-    # Note: scan is okay for MVP on smaller tables, but inefficient for large ones.
-    # Consider implementing a query or limiting the scan later.
+@st.cache_data(ttl=15)  # Poll the table version at most every 15 seconds
+def get_items_version(_state_manager: DynamoDBState) -> str:
+    """Returns a cheap version string for the table, used to invalidate the scan cache."""
     try:
-        # Using boto3 directly for scan pagination example
-        dynamodb = boto3.resource("dynamodb", region_name=_state_manager.aws_region)
-        table = dynamodb.Table(_state_manager.dynamodb_table_name)
-
-        scan_kwargs = {}
-        items = []
-        done = False
-        start_key = None
-        while not done:
-            if start_key:
-                scan_kwargs["ExclusiveStartKey"] = start_key
-            response = table.scan(**scan_kwargs)
-            items.extend(response.get("Items", []))
-            start_key = response.get("LastEvaluatedKey", None)
-            done = start_key is None
+        table = _state_manager.describe_table()
+        return f"{table.get('ItemCount', 0)}:{table.get('TableSizeBytes', 0)}"
+    except Exception:
+        # Fall back to the scan cache's own TTL if the table can't be described
+        return ""
+
+
+# Re-scan whenever the table version changes. DescribeTable's counts are only
+# refreshed periodically by DynamoDB (about every six hours), so the version mostly
+# catches bulk changes early; the TTL keeps the scan no staler than before.
+@st.cache_data(ttl=120)
+def fetch_all_metadata(
+    _state_manager: DynamoDBState, version: str = ""
+) -> Tuple[List[Dict], float]:
+    """Fetches the displayed columns of all items using a parallel (segmented) DynamoDB scan.
+
+    Returns:
+        Tuple of the items and a fetch token (the fetch time) identifying this load,
+        used to key the caches built from these items
+    """
+    # Note: scan is okay for MVP on smaller tables, but inefficient for large ones,
+    # so the admin GSI is queried instead when one is configured.
+    # Segments are scanned concurrently so the cold load is not a serial chain of 1 MB pages,
+    # and only the table columns are projected - full items are fetched per selection.
+    fetched_at = time.time()
+    try:
+        if ADMIN_INDEX_NAME:
+            try:
+                items = _state_manager.query_admin_index(
+                    ADMIN_INDEX_NAME, projection=DISPLAY_COLUMNS
+                )
+                st.success(f"Fetched {len(items)} items from index {ADMIN_INDEX_NAME}.")
+                return items, fetched_at
+            except ClientError as e:
+                st.warning(f"Index query failed, falling back to a table scan: {e}")
+        items = _state_manager.parallel_scan(projection=DISPLAY_COLUMNS)
         st.success(f"Fetched {len(items)} items from DynamoDB.")
-        return items
+        return items, fetched_at
     except ClientError as e:
         st.error(
             f"Error fetching data from DynamoDB (Table: {DYNAMODB_TABLE_NAME}): {e}"
         )
-        return []
+        return [], fetched_at
     except Exception as e:
         st.error(f"An unexpected error occurred during fetch: {e}")
-        return []
+        return [], fetched_at
 
 
-# --- Streamlit App UI ---
-st.title("Content Curator Admin View")
+@st.cache_data(ttl=300)  # Cache full items for 5 minutes
+def fetch_full_item(_state_manager: DynamoDBState, guid: str):
+    """Fetches every attribute of a single item, for the JSON details view."""
+    return _state_manager.get_metadata(guid)
 
-# Instructions in Sidebar
-st.sidebar.info("""
-**How to run:**
-1. Ensure AWS credentials are configured (e.g., via environment variables, `~/.aws/credentials`, or IAM role).
-2. Make sure your `.env` file contains `AWS_S3_BUCKET_NAME`, `AWS_DYNAMODB_TABLE_NAME`, `AWS_REGION`.
-3. Install dependencies: `pip install streamlit pandas python-dotenv boto3 botocore` (ensure `boto3` and `botocore` match your project needs).
-4. Navigate to your project's root directory in the terminal.
-5. Run: `streamlit run admin_view.py` (or the path to your script).
-""")
 
-# Fetch data
-metadata_items = fetch_all_metadata(state_manager)
+@st.cache_data(ttl=600, max_entries=512, show_spinner=False)
+def _cached_s3_get(path: str) -> str:
+    """Cached S3 read; failed reads raise so they are not cached."""
+    content = s3_storage.get_content(path)
+    if content is None:
+        raise FileNotFoundError(path)
+    return content
 
-if not metadata_items:
-    st.warning(f"No metadata found in DynamoDB table '{DYNAMODB_TABLE_NAME}'.")
-    # Optionally add a button to retry fetching
-    if st.button("Retry Fetch"):
-        st.cache_data.clear()  # Clear the cache
-        st.rerun()  # Rerun the script
-    st.stop()
 
-# Create tabs for different views
-tab_items, tab_curated = st.tabs(["Items", "Curated"])
+def cached_s3_get(path: str) -> Optional[str]:
+    """Fetches S3 content through the cache, returning None if it cannot be read."""
+    try:
+        return _cached_s3_get(path)
+    except FileNotFoundError:
+        return None
 
-# ===== ITEMS TAB =====
-with tab_items:
-    # Display data in a table
-    st.header("DynamoDB Metadata")
-    df = pd.DataFrame(metadata_items)
 
-    # Get field names from ContentItem dataclass
-    content_item_fields = [
-        field.name for field in ContentItem.__dataclass_fields__.values()
-    ]
+@st.cache_data(ttl=600, max_entries=1024, show_spinner=False)
+def s3_exists(path: str) -> bool:
+    """Cached HEAD probe for an S3 object (never downloads the body)."""
+    return s3_storage.object_exists(path)
 
-    # Define preferred display order for columns
-    preferred_order = [
-        "guid",
-        "published_date",
-        "title",
-        "md_path",
-        "source_url",
-        "fetch_date",
-        "summary_path",
-        "last_updated",
-        # Add other columns in your preferred order
-    ]
 
-    # Filter the preferred order to only include columns that exist in ContentItem
-    display_columns_ordered = [
-        col for col in preferred_order if col in content_item_fields
-    ]
+def cached_s3_get_if_exists(path: str) -> Optional[str]:
+    """Like cached_s3_get, but a missing object is remembered (via the cached probe)
+    instead of being re-requested with a GET on every rerun."""
+    if not s3_exists(path):
+        return None
+    return cached_s3_get(path)
 
-    # Add any remaining ContentItem fields that weren't in the preferred order
-    remaining_fields = [
-        field for field in content_item_fields if field not in display_columns_ordered
-    ]
-    display_columns_ordered.extend(remaining_fields)
 
+@st.cache_data(ttl=600, max_entries=512, show_spinner=False)
+def _cached_s3_get_preview(path: str) -> Tuple[str, int]:
+    """Cached ranged S3 read of the first MARKDOWN_PREVIEW_BYTES of an object."""
+    content, total_size = s3_storage.get_content_range(
+        path, 0, MARKDOWN_PREVIEW_BYTES - 1
+    )
+    if content is None:
+        raise FileNotFoundError(path)
+    return content, total_size
+
+
+def cached_s3_get_preview(path: str) -> Tuple[Optional[str], int]:
+    """Fetches the start of an S3 object through the cache.
+
+    Returns:
+        Tuple of the preview content (None if it cannot be read) and the object size
+    """
+    try:
+        return _cached_s3_get_preview(path)
+    except FileNotFoundError:
+        return None, 0
+
+
+def fetch_many(fetches: Dict[Optional[str], Callable[[str], Any]]) -> Dict[str, Any]:
+    """Runs several S3 fetches concurrently, returning a path -> result mapping.
+
+    Args:
+        fetches: Mapping of S3 path to the function used to fetch it; missing
+            (None/empty) paths are skipped
+    """
+    fetches = {path: fetch for path, fetch in fetches.items() if path}
+    if not fetches:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(fetches)) as executor:
+        futures = {
+            path: executor.submit(fetch, path) for path, fetch in fetches.items()
+        }
+        return {path: future.result() for path, future in futures.items()}
+
+
+# The builders below are keyed by fetch_all_metadata's fetch token rather than by
+# hashing the items on every rerun, so they are rebuilt exactly when the items are
+# re-fetched and always agree with each other. Only recent loads are kept.
+@st.cache_data(max_entries=4)
+def build_items_df(_items: List[Dict], fetch_token: float) -> pd.DataFrame:
+    """Builds the items table DataFrame with columns in display order."""
+    df = pd.DataFrame(_items)
     # Filter to columns that actually exist in the DataFrame
-    display_columns = [col for col in display_columns_ordered if col in df.columns]
+    df = df[[col for col in DISPLAY_COLUMNS if col in df.columns]]
+
+    # Low-cardinality columns are dictionary-encoded; the rest use Arrow-backed
+    # strings instead of one Python object per cell
+    return df.astype(
+        {
+            col: "category" if col in CATEGORY_COLUMNS else "string[pyarrow]"
+            for col in df.columns
+        }
+    )
 
-    # Display the dataframe - allow users to sort by clicking headers
-    st.dataframe(df[display_columns], use_container_width=True)
 
-    st.divider()
+@st.cache_data(max_entries=4)
+def build_item_options(_items_df: pd.DataFrame, fetch_token: float) -> pd.DataFrame:
+    """Builds the selectbox options, indexed by "Title (GUID)" display name.
 
-    # --- Item Detail View ---
-    st.header("View Item Content")
+    Returns:
+        DataFrame with the item's "guid" and its lowercased display name
+        ("search_name"), precomputed so searching doesn't re-lowercase every option
+    """
+    # Built column-wise with Arrow string kernels (no per-row Python strings);
+    # the astype is a no-op for the string[pyarrow] columns from build_items_df
+    frame = _items_df.reindex(columns=["title", "guid"]).astype("string[pyarrow]")
+    display_names = (
+        frame["title"].fillna("No Title") + " (" + frame["guid"].fillna("No GUID") + ")"
+    )
+    options = pd.DataFrame(
+        {
+            "guid": frame["guid"].array,
+            "search_name": display_names.str.lower().array,
+        },
+        index=pd.Index(display_names.array),
+    )
+    return options[~options.index.duplicated(keep="last")]
+
+
+@st.cache_data(max_entries=4)
+def build_guid_index(_items: List[Dict], fetch_token: float) -> Dict[str, Dict]:
+    """Maps each GUID to its item, for O(1) lookup of the selected item."""
+    return {item.get("guid"): item for item in _items}
 
-    # Create a list of options for the selectbox: "Title (GUID)"
-    # Handle cases where 'title' might be missing or empty
-    def get_item_display_name(item):
-        title = item.get("title", "No Title")
-        guid = item.get("guid", "No GUID")
-        return f"{title} ({guid})"
 
-    item_options = {
-        get_item_display_name(item): item.get("guid") for item in metadata_items
-    }
+@st.cache_data(ttl=300)  # Cache the listing for 5 minutes
+def list_curated_keys() -> List[str]:
+    """Lists the object keys under the curated/ prefix."""
+    # Reuse the cached S3Storage client (and its connection pool) across reruns
+    paginator = s3_storage.s3.get_paginator("list_objects_v2")
+    result = paginator.paginate(
+        Bucket=S3_BUCKET_NAME,
+        Prefix="curated/",
+        PaginationConfig={"PageSize": 1000},
+    ).build_full_result()
 
+    # Skip directory entries
+    return [
+        obj["Key"] for obj in result.get("Contents", []) if not obj["Key"].endswith("/")
+    ]
+
+
+# Search-and-view sections run as fragments, so typing in a search box or picking an
+# item reruns only that section rather than the whole script (fetch, table, tabs).
+@st.fragment
+def item_detail_fragment(item_options: pd.DataFrame, guid_index: Dict[str, Dict]):
+    """Search box, item selector and S3 content view for the Items tab."""
     # Add search functionality
     search_term = st.text_input("Search items", "")
-    filtered_options = {
-        k: v for k, v in item_options.items() if search_term.lower() in k.lower()
-    }
+    filtered_options = item_options
+    if search_term:
+        filtered_options = item_options[
+            item_options["search_name"].str.contains(search_term.lower(), regex=False)
+        ]
 
     selected_display_name = st.selectbox(
-        "Select item to view content:", options=filtered_options.keys()
+        "Select item to view content:", options=filtered_options.index.tolist()
     )
 
     if selected_display_name:
-        selected_guid = filtered_options[selected_display_name]
+        selected_guid = filtered_options.at[selected_display_name, "guid"]
         # Find the full selected item data using the GUID
-        # Use next() with a default to handle potential (though unlikely) errors
-        selected_item_list = [
-            item for item in metadata_items if item.get("guid") == selected_guid
-        ]
+        selected_item = guid_index.get(selected_guid)
 
-        if not selected_item_list:
+        if selected_item is None:
             st.error(f"Could not find data for selected GUID: {selected_guid}")
-            st.stop()
+            return
 
-        selected_item = selected_item_list[0]
+        # Fetch all S3 content for the selected item concurrently, then render from the results
+        markdown_s3_path = selected_item.get("md_path")
+        summary_s3_path = selected_item.get("summary_path")
+        short_summary_path = selected_item.get("short_summary_path")
+        # Large markdown is previewed with a ranged GET until the full file is requested
+        load_full_markdown = st.session_state.get("md_full_path") == markdown_s3_path
+        with st.spinner("Fetching content from S3..."):
+            contents = fetch_many(
+                {
+                    markdown_s3_path: cached_s3_get
+                    if load_full_markdown
+                    else cached_s3_get_preview,
+                    summary_s3_path: cached_s3_get_if_exists,
+                    short_summary_path: cached_s3_get_if_exists,
+                }
+            )
 
         col1, col2 = st.columns(2)  # Create two columns for content
 
-        # Fetch and display Markdown content from S3
-        markdown_s3_path = selected_item.get("md_path")
+        # Display Markdown content from S3
         with col1:
             # HEADING: Markdown
             st.subheader("Processed Markdown")
             if markdown_s3_path:
-                with st.spinner(f"Fetching {markdown_s3_path} from S3..."):
-                    try:
-                        # Use the S3Storage class method
-                        markdown_content = s3_storage.get_content(markdown_s3_path)
-                        if markdown_content:
-                            # Use st.text_area for potentially long markdown that preserves formatting
-                            st.text_area(
-                                "Markdown Content",
-                                markdown_content,
-                                height=400,
-                                key="md_content",
-                            )
-                            # Or use st.markdown if rendering is preferred (might hit limits for very large files)
-                            # st.markdown(markdown_content, unsafe_allow_html=False)
-                        elif markdown_content is None:
-                            st.warning(
-                                f"Could not retrieve content from S3 path: {markdown_s3_path}. Path might be incorrect or permissions missing."
-                            )
-                        else:  # Content is likely an empty string
-                            st.info(f"Content file at {markdown_s3_path} is empty.")
-                    except ClientError as e:
-                        st.error(
-                            f"AWS Error fetching content ({markdown_s3_path}): {e}"
+                if load_full_markdown:
+                    markdown_content = contents.get(markdown_s3_path)
+                    markdown_size = len(markdown_content or "")
+                else:
+                    markdown_content, markdown_size = contents.get(
+                        markdown_s3_path, (None, 0)
+                    )
+                if markdown_content:
+                    # Use st.text_area for potentially long markdown that preserves formatting
+                    st.text_area(
+                        "Markdown Content",
+                        markdown_content,
+                        height=400,
+                        key=f"md_content_{markdown_s3_path}_{load_full_markdown}",
+                    )
+                    if (
+                        not load_full_markdown
+                        and markdown_size > MARKDOWN_PREVIEW_BYTES
+                    ):
+                        st.caption(
+                            f"Showing the first {MARKDOWN_PREVIEW_BYTES // 1024} KB of "
+                            f"{markdown_size // 1024} KB."
                         )
-                    except Exception as e:
-                        st.error(f"Error fetching content ({markdown_s3_path}): {e}")
+                        st.button(
+                            "Load full content",
+                            on_click=st.session_state.update,
+                            kwargs={"md_full_path": markdown_s3_path},
+                        )
+                    # Or use st.markdown if rendering is preferred (might hit limits for very large files)
+                    # st.markdown(markdown_content, unsafe_allow_html=False)
+                elif markdown_content is None:
+                    st.warning(
+                        f"Could not retrieve content from S3 path: {markdown_s3_path}. Path might be incorrect or permissions missing."
+                    )
+                else:  # Content is likely an empty string
+                    st.info(f"Content file at {markdown_s3_path} is empty.")
             else:
                 st.info(
                     "No processed markdown S3 path ('md_path') found for this item."
@@ -246,12 +425,9 @@ with tab_items:
             st.subheader(f"Details for: {selected_item.get('title', selected_guid)}")
             # Display all metadata for the selected item as JSON in a collapsed expander
             with st.expander("View JSON Details", expanded=False):
-                st.json(selected_item)
-
-        # Fetch and display Summary content from S3
-        summary_s3_path = selected_item.get("summary_path")
-        short_summary_path = selected_item.get("short_summary_path")
+                st.json(fetch_full_item(state_manager, selected_guid) or selected_item)
 
+        # Display Summary content from S3
         with col2:
             # HEADING: summaries
             st.subheader("Summary")
@@ -259,67 +435,48 @@ with tab_items:
             # Display short summary if available
             if short_summary_path:
                 with st.expander("Short Summary", expanded=True):
-                    try:
-                        short_summary_content = s3_storage.get_content(
-                            short_summary_path
+                    short_summary_content = contents.get(short_summary_path)
+                    if short_summary_content:
+                        st.markdown(short_summary_content, unsafe_allow_html=False)
+                    elif short_summary_content is None:
+                        st.warning(
+                            f"Could not retrieve short summary from S3 path: {short_summary_path}."
                         )
-                        if short_summary_content:
-                            st.markdown(short_summary_content, unsafe_allow_html=False)
-                        else:
-                            st.info("Short summary file is empty.")
-                    except Exception as e:
-                        st.error(f"Error fetching short summary: {e}")
+                    else:
+                        st.info("Short summary file is empty.")
 
             # Display full summary
             if summary_s3_path:
-                with st.spinner(f"Fetching {summary_s3_path} from S3..."):
-                    try:
-                        # Use the S3Storage class method
-                        summary_content = s3_storage.get_content(summary_s3_path)
-                        if summary_content:
-                            # Or use st.markdown
-                            st.markdown(summary_content, unsafe_allow_html=False)
-                        elif summary_content is None:
-                            st.warning(
-                                f"Could not retrieve summary from S3 path: {summary_s3_path}. Path might be incorrect or permissions missing."
-                            )
-                        else:  # Content is likely an empty string
-                            st.info(f"Summary file at {summary_s3_path} is empty.")
-                    except ClientError as e:
-                        st.error(f"AWS Error fetching summary ({summary_s3_path}): {e}")
-                    except Exception as e:
-                        st.error(f"Error fetching summary ({summary_s3_path}): {e}")
+                summary_content = contents.get(summary_s3_path)
+                if summary_content:
+                    # Or use st.markdown
+                    st.markdown(summary_content, unsafe_allow_html=False)
+                elif summary_content is None:
+                    st.warning(
+                        f"Could not retrieve summary from S3 path: {summary_s3_path}. Path might be incorrect or permissions missing."
+                    )
+                else:  # Content is likely an empty string
+                    st.info(f"Summary file at {summary_s3_path} is empty.")
             else:
                 st.info("No summary S3 path ('summary_path') found for this item.")
 
-# ===== CURATED TAB =====
-with tab_curated:
-    st.header("Curated Content")
 
+@st.fragment
+def curated_fragment():
+    """Search box, file selector and content view for the Curated tab."""
     # Fetch curated content files from S3 "curated/" directory
     try:
-        s3_client = boto3.client("s3", region_name=AWS_REGION)
-        curated_files = []
-
-        # List objects with the curated/ prefix
-        paginator = s3_client.get_paginator("list_objects_v2")
-        pages = paginator.paginate(Bucket=S3_BUCKET_NAME, Prefix="curated/")
-
-        for page in pages:
-            if "Contents" in page:
-                for obj in page["Contents"]:
-                    # Skip directory entries
-                    if not obj["Key"].endswith("/"):
-                        curated_files.append(obj["Key"])
+        curated_files = list_curated_keys()
 
         if not curated_files:
             st.info("No curated content found in the curated/ directory.")
         else:
             # Add search functionality for curated content
             curated_search = st.text_input("Search curated content", "")
-            filtered_curated = [
-                file for file in curated_files if curated_search.lower() in file.lower()
-            ]
+            curated_series = pd.Series(curated_files, dtype=str)
+            filtered_curated = curated_series[
+                curated_series.str.contains(curated_search, case=False, regex=False)
+            ].tolist()
 
             if filtered_curated:
                 selected_file = st.selectbox(
@@ -332,7 +489,7 @@ with tab_curated:
                 if selected_file:
                     with st.spinner(f"Loading curated content from {selected_file}..."):
                         try:
-                            content = s3_storage.get_content(selected_file)
+                            content = cached_s3_get(selected_file)
                             if content:
                                 # Display the markdown content
                                 st.markdown(content, unsafe_allow_html=False)
@@ -346,3 +503,59 @@ with tab_curated:
     except Exception as e:
         st.error(f"Error accessing curated content directory: {e}")
         st.exception(e)
+
+
+# --- Streamlit App UI ---
+st.title("Content Curator Admin View")
+
+# Instructions in Sidebar
+st.sidebar.info("""
+**How to run:**
+1. Ensure AWS credentials are configured (e.g., via environment variables, `~/.aws/credentials`, or IAM role).
+2. Make sure your `.env` file contains `AWS_S3_BUCKET_NAME`, `AWS_DYNAMODB_TABLE_NAME`, `AWS_REGION`.
+3. Install dependencies: `pip install streamlit pandas python-dotenv boto3 botocore` (ensure `boto3` and `botocore` match your project needs).
+4. Navigate to your project's root directory in the terminal.
+5. Run: `streamlit run admin_view.py` (or the path to your script).
+""")
+
+# Fetch data
+items_version = get_items_version(state_manager)
+metadata_items, fetch_token = fetch_all_metadata(state_manager, items_version)
+
+if not metadata_items:
+    st.warning(f"No metadata found in DynamoDB table '{DYNAMODB_TABLE_NAME}'.")
+    # Optionally add a button to retry fetching
+    if st.button("Retry Fetch"):
+        st.cache_data.clear()  # Clear the cache
+        st.rerun()  # Rerun the script
+    st.stop()
+
+# Create tabs for different views
+tab_items, tab_curated = st.tabs(["Items", "Curated"])
+
+# ===== ITEMS TAB =====
+with tab_items:
+    # Display data in a table
+    st.header("DynamoDB Metadata")
+    df = build_items_df(metadata_items, fetch_token)
+
+    # Display the dataframe - allow users to sort by clicking headers
+    st.dataframe(df, use_container_width=True)
+
+    st.divider()
+
+    # --- Item Detail View ---
+    st.header("View Item Content")
+
+    # Options for the selectbox: "Title (GUID)" -> GUID, built once per data load
+    item_options = build_item_options(df, fetch_token)
+    guid_index = build_guid_index(metadata_items, fetch_token)
+
+    item_detail_fragment(item_options, guid_index)
+
+
+# ===== CURATED TAB =====
+with tab_curated:
+    st.header("Curated Content")
+
+    curated_fragment()
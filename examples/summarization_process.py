@@ -1,6 +1,7 @@
 import sys
 from datetime import datetime
 from pathlib import Path
+from typing import Dict, Optional, Tuple
 
 from loguru import logger
 
@@ -12,51 +13,68 @@ from src.content_curator.summarizers.summarizer import Summarizer
 from src.content_curator.utils import check_resources
 
 
-def summarize_content(item: ContentItem, s3_storage, summarizer):
+def summarize_content(
+    item: ContentItem, content: Optional[str], s3_storage, summarizer
+) -> Optional[Tuple[ContentItem, Dict[str, str]]]:
     """
-    Generate a summary for a given content item and store it in S3.
+    Generate a summary for a given content item.
+
+    Summaries are cached in S3 under the Summarizer's own cache keys (model, prompt
+    and article body), so content the pipeline has already summarized is copied
+    server-side instead of re-summarized.
 
     Args:
         item: ContentItem object to summarize
-        s3_storage: S3Storage object for accessing content
+        content: The item's markdown content, already fetched from S3
+        s3_storage: S3Storage object for the summary cache
         summarizer: Summarizer object to generate summaries
 
     Returns:
-        Updated ContentItem with summary information
+        Tuple of the updated ContentItem and a mapping of S3 paths to the summaries
+        still to store there, or None if the item could not be summarized
     """
     guid = item.guid
-    md_path = item.md_path
-
-    if not md_path:
-        logger.warning(f"Item {guid} has no md_path, skipping")
-        return None
 
-    # Get content from S3
-    content = s3_storage.get_content(md_path)
     if not content:
-        logger.warning(f"Failed to retrieve content for {guid} at {md_path}")
+        logger.warning(f"Failed to retrieve content for {guid} at {item.md_path}")
         return None
 
-    # Generate summary
-    logger.info(f"Generating summary for item {guid}")
-    try:
-        summary = summarizer.create_summary(content)
-        short_summary = summarizer.create_short_summary(content)
+    summary_path = f"processed/summaries/{guid}.md"
+    short_summary_path = f"processed/short_summaries/{guid}.md"
 
-        # Store summaries in S3
-        summary_path = f"processed/summaries/{guid}.md"
-        short_summary_path = f"processed/short_summaries/{guid}.md"
+    cached_summary_path = summarizer._summary_cache_key(content, "standard")
+    cached_short_summary_path = summarizer._summary_cache_key(content, "brief")
 
-        s3_storage.store_content(summary_path, summary)
-        s3_storage.store_content(short_summary_path, short_summary)
+    try:
+        if (
+            s3_storage.object_exists(cached_summary_path)
+            and s3_storage.object_exists(cached_short_summary_path)
+            and s3_storage.copy_object(cached_summary_path, summary_path)
+            and s3_storage.copy_object(cached_short_summary_path, short_summary_path)
+        ):
+            logger.info(f"Reusing cached summary for item {guid}")
+            to_store = {}
+        else:
+            # Generate both summaries in one LLM batch
+            logger.info(f"Generating summary for item {guid}")
+            summaries = summarizer.summarize_text_multi(content, ("standard", "brief"))
+            summary, short_summary = summaries["standard"], summaries["brief"]
+            if not (summary and short_summary):
+                logger.error(f"Failed to generate summaries for item {guid}")
+                return None
+            to_store = {
+                summary_path: summary,
+                short_summary_path: short_summary,
+                cached_summary_path: summary,
+                cached_short_summary_path: short_summary,
+            }
 
         # Update item with summary information
-        item.is_summarized = True
         item.summary_path = summary_path
         item.short_summary_path = short_summary_path
         item.last_updated = datetime.now().isoformat()
 
-        return item
+        return item, to_store
 
     except Exception as e:
         logger.error(f"Error summarizing content for {guid}: {str(e)}")
@@ -92,14 +110,38 @@ def run_summarization_process():
 
     logger.info(f"Found {len(items_to_summarize)} items that need summarization.")
 
-    # Process each item
+    items_with_content = []
     for item in items_to_summarize:
-        updated_item = summarize_content(item, s3_storage, summarizer)
+        if item.md_path:
+            items_with_content.append(item)
+        else:
+            logger.warning(f"Item {item.guid} has no md_path, skipping")
+
+    # Fetch all markdown content from S3 concurrently
+    contents = s3_storage.get_contents([item.md_path for item in items_with_content])
+
+    # Summarize each item (LLM-bound, so this stays sequential)
+    summarized = []
+    for item in items_with_content:
+        result = summarize_content(
+            item, contents.get(item.md_path), s3_storage, summarizer
+        )
+        if result:
+            summarized.append(result)
+
+    # Store all summaries in S3 concurrently
+    stored = s3_storage.store_contents(
+        {path: text for _, summaries in summarized for path, text in summaries.items()}
+    )
+
+    for updated_item, summaries in summarized:
+        if not all(stored.get(path) for path in summaries):
+            logger.error(f"Failed to store summaries for item {updated_item.guid}")
+            continue
 
-        if updated_item:
-            # Update item in DynamoDB
-            state_manager.update_item(updated_item)
-            logger.info(f"Updated metadata for item {updated_item.guid}")
+        # Update item in DynamoDB (a single UpdateItem; no read of the stored item)
+        state_manager.update_item(updated_item)
+        logger.info(f"Updated metadata for item {updated_item.guid}")
 
 
 if __name__ == "__main__":
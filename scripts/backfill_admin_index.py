@@ -0,0 +1,25 @@
+import sys
+from pathlib import Path
+
+from loguru import logger
+
+sys.path.append(str(Path(__file__).parent.parent))
+
+from src.content_curator.config import config
+from src.content_curator.storage.dynamodb_state import DynamoDBState
+
+
+def backfill_admin_index():
+    """
+    Stamp the admin index key on items written before the admin GSI existed,
+    so the admin view's index query lists every item.
+    """
+    state_manager = DynamoDBState(
+        dynamodb_table_name=config.dynamodb_table_name, aws_region=config.aws_region
+    )
+    updated = state_manager.backfill_admin_index_key()
+    logger.info(f"Backfill complete: {updated} items updated")
+
+
+if __name__ == "__main__":
+    backfill_admin_index()
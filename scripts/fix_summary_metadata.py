@@ -33,11 +33,15 @@ def fix_summary_metadata(dry_run=False, evaluate_content=False):
     # Setup processor for content evaluation if needed
     processor = MarkdownProcessor() if evaluate_content else None
 
-    # Get all processed items from DynamoDB as ContentItem objects
-    processed_items = state_manager.get_items_by_status_flags(
-        is_processed=True, limit=1000, as_content_items=True
+    # Get processed but unsummarized items from DynamoDB as ContentItem objects (the
+    # scan filters them server-side rather than returning every item)
+    processed_items = state_manager.get_items_by_status_paths(
+        md_path_exists=True,
+        summary_path_exists=False,
+        limit=1000,
+        as_content_items=True,
     )
-    logger.info(f"Found {len(processed_items)} processed items to check")
+    logger.info(f"Found {len(processed_items)} unsummarized items to check")
 
     # Log S3 paths being used
     logger.info("Using S3 paths:")
@@ -46,6 +50,9 @@ def fix_summary_metadata(dry_run=False, evaluate_content=False):
 
     updated_count = 0
     content_evaluated_count = 0
+    # Items needing an update, written together once every item has been checked
+    items_to_update = []
+    updated_at = datetime.now().isoformat()
 
     for item in processed_items:
         guid = item.guid
@@ -54,7 +61,7 @@ def fix_summary_metadata(dry_run=False, evaluate_content=False):
             continue
 
         # Check current item status
-        is_summarized = item.is_summarized
+        is_summarized = bool(item.summary_path)
         to_be_summarized = item.to_be_summarized
 
         # Track if item needs update
@@ -71,7 +78,6 @@ def fix_summary_metadata(dry_run=False, evaluate_content=False):
         # If summaries exist but metadata doesn't reflect it, mark for update
         if standard_exists and not is_summarized:
             logger.info(f"Item {guid}: Found summary in S3 but not marked in metadata")
-            item.is_summarized = True
             item.summary_path = standard_summary_path
             needs_update = True
 
@@ -111,16 +117,21 @@ def fix_summary_metadata(dry_run=False, evaluate_content=False):
 
         # Update item if needed
         if needs_update:
-            item.last_updated = datetime.now().isoformat()
+            item.last_updated = updated_at
 
             if not dry_run:
-                state_manager.update_item(item)
-                logger.info(f"Updated item {guid} in DynamoDB")
+                items_to_update.append(item)
             else:
                 logger.info(f"[DRY RUN] Would update item {guid} in DynamoDB")
 
             updated_count += 1
 
+    if items_to_update:
+        if state_manager.batch_update_items(items_to_update):
+            logger.info(f"Updated {len(items_to_update)} items in DynamoDB")
+        else:
+            logger.error("Failed to update items in DynamoDB")
+
     if dry_run:
         logger.info(
             f"Completed! Found {updated_count} items that would be updated (dry run)"
@@ -1,23 +1,29 @@
+from __future__ import annotations
+
 import argparse
+import hashlib
+import itertools
 import sys
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Optional, Tuple
+from typing import TYPE_CHECKING, Iterable, Iterator, List, Optional, Tuple
 
 import yaml
-from dotenv import load_dotenv
 from loguru import logger
 
 sys.path.append(str(Path(__file__).parent.parent))
 from src.content_curator.config import config
-from src.content_curator.curator.newsletter_curator import NewsletterCurator
-from src.content_curator.distributors.email_distributor import EmailDistributor
-from src.content_curator.fetchers.rss_fetcher import RSSFetcher
 from src.content_curator.models import ContentItem
-from src.content_curator.processors.markdown_processor import MarkdownProcessor
-from src.content_curator.storage.dynamodb_state import DynamoDBState
-from src.content_curator.storage.s3_storage import S3Storage
-from src.content_curator.summarizers.summarizer import Summarizer
-from src.content_curator.utils import check_resources
+
+# Stage implementations (fetcher, processor, summarizer, curator, distributor) are
+# imported inside the run_*_stage functions, so a run only pays the import cost of
+# the stages it actually uses (the LLM client libraries in particular are slow to load).
+# The AWS clients (boto3/botocore) are likewise only imported by setup_services, so
+# --help and argument errors return without loading them
+if TYPE_CHECKING:
+    from src.content_curator.storage.dynamodb_state import DynamoDBState
+    from src.content_curator.storage.s3_storage import S3Storage
 
 # Configure logging
 # logger.add(
@@ -26,11 +32,20 @@ from src.content_curator.utils import check_resources
 #     retention=config.log_retention,
 #     level=config.log_level,
 #     format=config.log_format,
+#     enqueue=True,  # format and write records off the pipeline's thread
 # )
 
+# Number of fetched items handed from the process stage to the summarize stage at a time
+PIPELINE_CHUNK_SIZE = 10
 
-def parse_arguments():
-    """Parse command line arguments to control pipeline stages."""
+# Longest content (in characters) save_last_item writes to /tmp; anything beyond it is
+# cut off, so a pathological page can't fill a tmpfs with a debugging copy
+LAST_ITEM_MAX_CHARS = 50_000_000
+
+
+@lru_cache(maxsize=None)
+def build_parser() -> argparse.ArgumentParser:
+    """Build the command line argument parser (once per process)."""
     parser = argparse.ArgumentParser(description="Content Curator Pipeline")
 
     # Add arguments for each pipeline stage
@@ -127,8 +142,13 @@ def parse_arguments():
         help="S3 path of the standard markdown content for browser view. Defaults to 'curated/latest_standard.md'.",
     )
 
+    return parser
+
+
+def parse_arguments(argv: Optional[List[str]] = None):
+    """Parse command line arguments to control pipeline stages."""
     # Parse the arguments
-    args = parser.parse_args()
+    args = build_parser().parse_args(argv)
 
     # If RSS URL is provided, enable appropriate stages
     if args.rss_url:
@@ -171,16 +191,58 @@ def parse_arguments():
     return args
 
 
+@lru_cache(maxsize=None)
+def load_environment() -> None:
+    """Load environment variables from .env (once per process)."""
+    from dotenv import load_dotenv
+
+    load_dotenv()
+
+
+@lru_cache(maxsize=None)
 def setup_services() -> Tuple[DynamoDBState, S3Storage]:
-    """Initialize and check AWS services."""
-    # Initialize services with config values
+    """
+    Initialize and check AWS services.
+
+    The clients are created and checked once per process and reused by later calls,
+    so repeated pipeline runs (e.g. from a long-lived scheduler) don't rebuild them.
+    """
+    import boto3
+    from botocore.config import Config
+
+    from src.content_curator.storage.dynamodb_state import DynamoDBState
+    from src.content_curator.storage.s3_storage import S3Storage
+    from src.content_curator.utils import check_resources
+
+    # One session for both clients, so the credential chain is only resolved once
+    session = boto3.Session(region_name=config.aws_region)
+    # Let the adaptive retry mode back off if request bursts get throttled, and keep
+    # idle pooled connections alive between stages
+    base_config = Config(
+        retries={"max_attempts": 3, "mode": "adaptive"}, tcp_keepalive=True
+    )
+
+    # Initialize services with config values. DynamoDB is scanned in parallel
+    # segments (with the next page prefetched), so its pool is raised from the
+    # default of 10 too
     state_manager = DynamoDBState(
         dynamodb_table_name=config.dynamodb_table_name,
         aws_region=config.aws_region,
+        botocore_config=base_config.merge(
+            Config(max_pool_connections=config.dynamodb_max_pool_connections)
+        ),
+        cache_items=True,
+        session=session,
     )
+    # Stages upload and download S3 objects from several threads at once (e.g. one
+    # per feed, each storing its entries concurrently), so raise the default pool of 10
     s3_storage = S3Storage(
         s3_bucket_name=config.s3_bucket_name,
         aws_region=config.aws_region,
+        botocore_config=base_config.merge(
+            Config(max_pool_connections=config.s3_max_pool_connections)
+        ),
+        session=session,
     )
 
     # Check if resources exist
@@ -196,16 +258,16 @@ def setup_services() -> Tuple[DynamoDBState, S3Storage]:
     return state_manager, s3_storage
 
 
-def run_fetch_stage(
+def create_fetcher(
     state_manager: DynamoDBState,
     s3_storage: S3Storage,
-    specific_id: Optional[str] = None,
     rss_url: Optional[str] = None,
     rss_url_file: Optional[Path] = Path(__file__).parent / "data" / "rss_urls.txt",
     fetch_max_items: Optional[int] = None,
-    overwrite_flag: bool = False,
-) -> List[ContentItem]:
-    """Run the fetch stage to get new content."""
+):
+    """Create the RSS fetcher for the fetch stage."""
+    from src.content_curator.fetchers.rss_fetcher import RSSFetcher
+
     # Initialize fetcher with either a file of URLs or a specific RSS URL
     if rss_url:
         # Create RSSFetcher with the specific RSS URL
@@ -225,26 +287,69 @@ def run_fetch_stage(
             state_manager=state_manager,
         )
 
+    return fetcher
+
+
+def run_fetch_stage(
+    state_manager: DynamoDBState,
+    s3_storage: S3Storage,
+    specific_id: Optional[str] = None,
+    rss_url: Optional[str] = None,
+    rss_url_file: Optional[Path] = Path(__file__).parent / "data" / "rss_urls.txt",
+    fetch_max_items: Optional[int] = None,
+    overwrite_flag: bool = False,
+) -> List[ContentItem]:
+    """Run the fetch stage to get new content."""
+    fetcher = create_fetcher(
+        state_manager, s3_storage, rss_url, rss_url_file, fetch_max_items
+    )
+
     logger.info("Fetching content...")
     return fetcher.fetch_and_update_state(specific_id, overwrite_flag)
 
 
-def run_process_stage(
+def iter_fetch_stage(
     state_manager: DynamoDBState,
     s3_storage: S3Storage,
     fetched_items: List[ContentItem],
+    specific_id: Optional[str] = None,
+    rss_url: Optional[str] = None,
+    rss_url_file: Optional[Path] = Path(__file__).parent / "data" / "rss_urls.txt",
+    fetch_max_items: Optional[int] = None,
+    overwrite_flag: bool = False,
+) -> Iterator[ContentItem]:
+    """
+    Run the fetch stage lazily, yielding items as each feed is fetched and stored.
+
+    Args:
+        state_manager: DynamoDB state manager
+        s3_storage: S3 storage manager
+        fetched_items: List every yielded item is also appended to
+        specific_id: Optional specific item ID to fetch
+        rss_url: Optional specific RSS feed URL to fetch
+        rss_url_file: Path to the file of RSS feed URLs
+        fetch_max_items: Maximum number of most recent items to fetch per feed
+        overwrite_flag: Whether to overwrite existing content
+    """
+    fetcher = create_fetcher(
+        state_manager, s3_storage, rss_url, rss_url_file, fetch_max_items
+    )
+
+    logger.info("Fetching content...")
+    for feed_items in fetcher.iter_fetch_and_update_state(specific_id, overwrite_flag):
+        fetched_items.extend(feed_items)
+        yield from feed_items
+
+
+def get_items_to_process(
+    state_manager: DynamoDBState,
+    fetched_items: List[ContentItem],
     fetch_flag: bool,
     overwrite_flag: bool,
     specific_id: Optional[str] = None,
     fetch_max_items: Optional[int] = None,
 ) -> List[ContentItem]:
-    """Run the processing stage to convert HTML to markdown."""
-    # Initialize processor
-    processor: MarkdownProcessor = MarkdownProcessor(
-        s3_storage=s3_storage,
-        state_manager=state_manager,
-    )
-
+    """Get the items for the process stage, from the fetch stage or the database."""
     # If we got items from fetch stage, use those
     if fetch_flag and fetched_items:
         items_to_process = fetched_items
@@ -265,6 +370,39 @@ def run_process_stage(
             return []
 
     logger.info(f"--- Loaded {len(items_to_process)} items for processing ---")
+    return items_to_process
+
+
+def run_process_stage(
+    state_manager: DynamoDBState,
+    s3_storage: S3Storage,
+    fetched_items: List[ContentItem],
+    fetch_flag: bool,
+    overwrite_flag: bool,
+    specific_id: Optional[str] = None,
+    fetch_max_items: Optional[int] = None,
+) -> List[ContentItem]:
+    """Run the processing stage to convert HTML to markdown."""
+    from src.content_curator.processors.markdown_processor import MarkdownProcessor
+
+    # Initialize processor
+    processor: MarkdownProcessor = MarkdownProcessor(
+        s3_storage=s3_storage,
+        state_manager=state_manager,
+        conversion_workers=config.processor_conversion_workers,
+    )
+
+    items_to_process = get_items_to_process(
+        state_manager,
+        fetched_items,
+        fetch_flag,
+        overwrite_flag,
+        specific_id,
+        fetch_max_items,
+    )
+    if not items_to_process:
+        return []
+
     logger.info("Processing content...")
 
     # Process items and update state
@@ -296,12 +434,16 @@ def run_summarize_stage(
         fetch_max_items: Maximum number of items to process
         summary_types: List of summary types to generate
     """
+    from src.content_curator.summarizers.summarizer import Summarizer
+
     # Initialize summarizer
     logger.info("Summarizing content...")
     summarizer = Summarizer(
         model_name=config.summarizer_model_name,
         s3_storage=s3_storage,
         state_manager=state_manager,
+        max_concurrency=config.summarizer_max_concurrency,
+        requests_per_minute=config.summarizer_requests_per_minute,
     )
 
     # If we got items from process stage, use those
@@ -325,17 +467,125 @@ def run_summarize_stage(
 
     logger.info(f"--- Loaded {len(items_to_summarize)} items for summarization ---")
 
-    # Determine summary types based on full_summary flag
-    types_to_generate = summary_types or config.default_summary_types
-    if full_summary:
-        types_to_generate = ["brief", "standard"]
+    types_to_generate = get_summary_types(full_summary, summary_types)
     logger.info(f"Generating summary types: {types_to_generate}")
 
     # Summarize items and update state
-    return summarizer.summarize_and_update_state(
-        items_to_summarize, overwrite_flag, summary_types=types_to_generate
+    try:
+        return summarizer.summarize_and_update_state(
+            items_to_summarize, overwrite_flag, summary_types=types_to_generate
+        )
+    finally:
+        summarizer.close()
+
+
+def get_summary_types(
+    full_summary: bool = False, summary_types: Optional[List[str]] = None
+) -> List[str]:
+    """Determine summary types to generate based on the full_summary flag."""
+    if full_summary:
+        return ["brief", "standard"]
+    return summary_types or config.default_summary_types
+
+
+def run_pipelined_process_and_summarize_stages(
+    state_manager: DynamoDBState,
+    s3_storage: S3Storage,
+    items_to_process: Iterable[ContentItem],
+    overwrite_flag: bool,
+    full_summary: bool = False,
+    summary_types: Optional[List[str]] = None,
+    chunk_size: int = PIPELINE_CHUNK_SIZE,
+    keep_last_content: bool = False,
+) -> Tuple[List[ContentItem], List[ContentItem]]:
+    """
+    Run the process and summarize stages over the same items as a pipeline.
+
+    Items are split into chunks; each stage handles one chunk at a time, in order,
+    but the summarize stage starts on a chunk as soon as it has been processed, so
+    summarizing chunk k overlaps processing chunk k+1 instead of waiting for every
+    item to be processed. Processed items keep their markdown in memory, so the
+    summarize stage never reads it back from S3; once a chunk is summarized, its
+    items' content is released (bar the last item's if keep_last_content is set).
+    items_to_process may be a lazy iterator (e.g. from iter_fetch_stage): chunks are
+    taken from it as it produces items, so fetching overlaps both stages too.
+
+    Args:
+        state_manager: DynamoDB state manager
+        s3_storage: S3 storage manager
+        items_to_process: Items to process, from the fetch stage or the database
+        overwrite_flag: Whether to overwrite existing processed content and summaries
+        full_summary: If True, generate both brief and full summaries
+        summary_types: List of summary types to generate
+        chunk_size: Number of items per pipeline chunk
+        keep_last_content: If True, keep the last processed item's content in memory
+            (for save_last_item)
+
+    Returns:
+        Tuple of (processed items, summarized items)
+    """
+    from src.content_curator.processors.markdown_processor import MarkdownProcessor
+    from src.content_curator.summarizers.summarizer import Summarizer
+
+    processor = MarkdownProcessor(
+        s3_storage=s3_storage,
+        state_manager=state_manager,
+        conversion_workers=config.processor_conversion_workers,
+    )
+    summarizer = Summarizer(
+        model_name=config.summarizer_model_name,
+        s3_storage=s3_storage,
+        state_manager=state_manager,
+        max_concurrency=config.summarizer_max_concurrency,
+        requests_per_minute=config.summarizer_requests_per_minute,
+    )
+    types_to_generate = get_summary_types(full_summary, summary_types)
+    logger.info(
+        f"Pipelining items through process and summarize in chunks of {chunk_size} "
+        f"(summary types: {types_to_generate})"
     )
 
+    # Once a chunk is summarized its content is stored in S3 and no longer needed in
+    # memory, except the latest processed item's if keep_last_content is set
+    latest_processed: List[ContentItem] = []
+
+    def summarize_when_processed(processed_future: Future) -> List[ContentItem]:
+        processed = processed_future.result()
+        summarized = summarizer.summarize_and_update_state(
+            processed, overwrite_flag, summary_types=types_to_generate
+        )
+        if processed:
+            kept = processed[-1:] if keep_last_content else []
+            for item in latest_processed + processed[: len(processed) - len(kept)]:
+                item.release_content()
+            latest_processed[:] = kept
+        return summarized
+
+    # One worker per stage keeps each stage sequential while the stages overlap
+    with (
+        ThreadPoolExecutor(max_workers=1) as process_pool,
+        ThreadPoolExecutor(max_workers=1) as summarize_pool,
+    ):
+        stage_futures = []
+        items = iter(items_to_process)
+        while chunk := list(itertools.islice(items, chunk_size)):
+            processed_future = process_pool.submit(
+                processor.process_and_update_state, chunk, overwrite_flag
+            )
+            summarized_future = summarize_pool.submit(
+                summarize_when_processed, processed_future
+            )
+            stage_futures.append((processed_future, summarized_future))
+
+        processed_items: List[ContentItem] = []
+        summarized_items: List[ContentItem] = []
+        for processed_future, summarized_future in stage_futures:
+            processed_items.extend(processed_future.result())
+            summarized_items.extend(summarized_future.result())
+
+    summarizer.close()
+    return processed_items, summarized_items
+
 
 def run_curate_stage(
     state_manager: DynamoDBState,
@@ -347,6 +597,8 @@ def run_curate_stage(
     """Run the curation stage to create newsletters and save them to S3."""
     logger.info("Creating newsletter from recent content...")
 
+    from src.content_curator.curator.newsletter_curator import NewsletterCurator
+
     # Initialize the newsletter curator
     curator = NewsletterCurator(state_manager=state_manager, s3_storage=s3_storage)
 
@@ -358,6 +610,60 @@ def run_curate_stage(
     )
 
 
+def write_local_file(output_path: str, content: str) -> bool:
+    """
+    Write text to a local file as UTF-8 in a single binary write, skipping the write if
+    the file already holds the same content.
+
+    A SHA-256 of the written content is kept in a sibling .sha256 file, with the size
+    and modification time the file had when written, so unchanged content is detected
+    without reading the (possibly large) file back, and a file edited or truncated
+    since is written again.
+
+    Args:
+        output_path: Path of the file to write
+        content: The text to write
+
+    Returns:
+        True if the file was written, False if it was already up to date
+    """
+    path = Path(output_path)
+    hash_path = path.with_name(path.name + ".sha256")
+    data = content.encode("utf-8")
+    digest = hashlib.sha256(data).hexdigest()
+
+    if path.exists() and hash_path.exists():
+        stat = path.stat()
+        if stat.st_size == len(data) and hash_path.read_text() == (
+            f"{digest} {stat.st_size} {stat.st_mtime_ns}"
+        ):
+            return False
+
+    path.write_bytes(data)
+    stat = path.stat()
+    hash_path.write_text(f"{digest} {stat.st_size} {stat.st_mtime_ns}")
+    return True
+
+
+def log_items(action: str, items: List[ContentItem]):
+    """
+    Log each item handled by a stage at DEBUG level.
+
+    The message is built lazily, so when DEBUG is disabled the items aren't
+    formatted (or even iterated) at all.
+
+    Args:
+        action: What the stage did to the items, e.g. "Fetched"
+        items: The items to log
+    """
+    logger.opt(lazy=True).debug(
+        "{}",
+        lambda: "\n".join(
+            f"{action} item: {item.guid} - {item.title}" for item in items
+        ),
+    )
+
+
 def save_last_item(processed_items: List[ContentItem], summarize_flag: bool):
     """Save the last processed item's content to a local file. For testing and debugging."""
     if not processed_items:
@@ -366,17 +672,25 @@ def save_last_item(processed_items: List[ContentItem], summarize_flag: bool):
     try:
         last_item = processed_items[-1]
         markdown_content = last_item.markdown_content or ""
+        if len(markdown_content) > LAST_ITEM_MAX_CHARS:
+            logger.warning(
+                f"Last item's markdown is {len(markdown_content)} chars, saving only "
+                f"the first {LAST_ITEM_MAX_CHARS}"
+            )
+            markdown_content = markdown_content[:LAST_ITEM_MAX_CHARS]
         output_path = "/tmp/last_processed_item.md"
 
-        with open(output_path, "w", encoding="utf-8") as f:
-            f.write(markdown_content)
-        logger.info(f"Saved last item's markdown content to {output_path}")
+        if write_local_file(output_path, markdown_content):
+            logger.info(f"Saved last item's markdown content to {output_path}")
+        else:
+            logger.debug(f"{output_path} already holds the last item's markdown")
 
         if summarize_flag and last_item.summary:
             summary_path = "/tmp/last_item_summary.md"
-            with open(summary_path, "w", encoding="utf-8") as f:
-                f.write(last_item.summary)
-            logger.info(f"Saved last item's summary to {summary_path}")
+            if write_local_file(summary_path, last_item.summary):
+                logger.info(f"Saved last item's summary to {summary_path}")
+            else:
+                logger.debug(f"{summary_path} already holds the last item's summary")
     except Exception as e:
         logger.error(f"Error saving markdown content: {e}")
 
@@ -402,6 +716,8 @@ def run_distribute_stage(
     """
     logger.info("Distributing newsletter via email...")
 
+    from src.content_curator.distributors.email_distributor import EmailDistributor
+
     # Initialize the email distributor
     distributor = EmailDistributor(s3_storage=s3_storage)
 
@@ -413,8 +729,16 @@ def run_distribute_stage(
     )
 
 
-def main():
-    """Main entry point for the content curation pipeline."""
+def main(argv: Optional[List[str]] = None):
+    """
+    Main entry point for the content curation pipeline.
+
+    Args:
+        argv: Command line arguments to parse (defaults to sys.argv)
+    """
+    # Parse command line arguments first, so --help and usage errors exit immediately
+    args = parse_arguments(argv)
+
     logger.info(f"\n{'-' * 50}\nmain.py execution started\n{'-' * 50}\n")
 
     # Log the configuration in YAML format
@@ -424,24 +748,59 @@ def main():
     )
 
     # Load environment variables
-    load_dotenv()
-
-    # Parse command line arguments
-    args = parse_arguments()
+    load_environment()
 
     # Log the arguments
     logger.info(f"Command arguments: {vars(args)}")
 
     # Initialize services
     state_manager, s3_storage = setup_services()
+    # Items are cached for the stages of one run only
+    state_manager.clear_item_cache()
 
     # Initialize variables to track items through pipeline
     fetched_items: List[ContentItem] = []
     processed_items: List[ContentItem] = []
     summarized_items: List[ContentItem] = []
 
+    # When fetch, process and summarize all run, stream fetched items into the
+    # process/summarize pipeline feed by feed instead of waiting for every feed
+    streamed = False
+    if args.fetch and args.process and args.summarize:
+        logger.info(
+            "\n\nRunning pipelined fetch, process and summarize stages...\n\n".upper()
+        )
+        processed_items, summarized_items = run_pipelined_process_and_summarize_stages(
+            state_manager,
+            s3_storage,
+            iter_fetch_stage(
+                state_manager,
+                s3_storage,
+                fetched_items,
+                args.id,
+                args.rss_url,
+                args.rss_url_file,
+                args.fetch_max_items,
+                args.overwrite,
+            ),
+            args.overwrite,
+            full_summary=args.full_summary,
+            summary_types=args.summary_types,
+            keep_last_content=args.save_locally,
+        )
+        streamed = bool(fetched_items)
+        logger.info(
+            f"Fetch stage completed with {len(fetched_items)} items, "
+            f"process stage completed with {len(processed_items)} items, "
+            f"summarize stage completed with {len(summarized_items)} items"
+        )
+
+        # Save last processed item if requested
+        if streamed and args.save_locally:
+            save_last_item(processed_items, args.summarize)
+
     # Run fetch stage if enabled
-    if args.fetch:
+    elif args.fetch:
         logger.info("\n\nRunning fetch stage...\n\n".upper())
         fetched_items = run_fetch_stage(
             state_manager,
@@ -453,11 +812,45 @@ def main():
             args.overwrite,
         )
         logger.info(f"Fetch stage completed with {len(fetched_items)} items")
-        for item in fetched_items:
-            logger.debug(f"Fetched item: {item.guid} - {item.title}")
+        log_items("Fetched", fetched_items)
+
+    # When process and summarize both run, pipeline them over the same items rather
+    # than waiting for every item to be processed. If there is nothing to process,
+    # the summarize stage below still picks up any processed but unsummarized items
+    pipelined = False
+    if args.process and args.summarize and not streamed:
+        items_to_process = get_items_to_process(
+            state_manager,
+            fetched_items,
+            args.fetch,
+            args.overwrite,
+            args.id,
+            args.fetch_max_items,
+        )
+        pipelined = bool(items_to_process)
+
+    if pipelined:
+        logger.info("\n\nRunning pipelined process and summarize stages...\n\n".upper())
+        processed_items, summarized_items = run_pipelined_process_and_summarize_stages(
+            state_manager,
+            s3_storage,
+            items_to_process,
+            args.overwrite,
+            full_summary=args.full_summary,
+            summary_types=args.summary_types,
+            keep_last_content=args.save_locally,
+        )
+        logger.info(
+            f"Process stage completed with {len(processed_items)} items, "
+            f"summarize stage completed with {len(summarized_items)} items"
+        )
+
+        # Save last processed item if requested
+        if args.save_locally:
+            save_last_item(processed_items, args.summarize)
 
     # Run process stage if enabled
-    if args.process:
+    if args.process and not args.summarize:
         logger.info("\n\nRunning process stage...\n\n".upper())
         logger.debug(
             f"Process stage starting with {len(fetched_items)} items from fetch stage"
@@ -472,15 +865,14 @@ def main():
             args.fetch_max_items,
         )
         logger.info(f"Process stage completed with {len(processed_items)} items")
-        for item in processed_items:
-            logger.debug(f"Processed item: {item.guid} - {item.title}")
+        log_items("Processed", processed_items)
 
         # Save last processed item if requested
         if args.save_locally:
             save_last_item(processed_items, args.summarize)
 
     # Run summarize stage if enabled
-    if args.summarize:
+    if args.summarize and not (pipelined or streamed):
         logger.info("\n\nRunning summarize stage...\n\n".upper())
         logger.debug(
             f"Summarize stage starting with {len(processed_items)} items from process stage"
@@ -497,8 +889,7 @@ def main():
             summary_types=args.summary_types,
         )
         logger.info(f"Summarize stage completed with {len(summarized_items)} items")
-        for item in summarized_items:
-            logger.debug(f"Summarized item: {item.guid} - {item.title}")
+        log_items("Summarized", summarized_items)
 
         # Save last summarized item if requested (and not already saved in process stage)
         if args.save_locally and not args.process:
@@ -525,11 +916,14 @@ def main():
             if curated_content and args.save_locally:
                 try:
                     output_path = f"/tmp/latest_newsletter_{summary_type}.md"
-                    with open(output_path, "w", encoding="utf-8") as f:
-                        f.write(curated_content)
-                    logger.info(
-                        f"Saved latest {summary_type} newsletter to {output_path}"
-                    )
+                    if write_local_file(output_path, curated_content):
+                        logger.info(
+                            f"Saved latest {summary_type} newsletter to {output_path}"
+                        )
+                    else:
+                        logger.debug(
+                            f"{output_path} already holds the latest {summary_type} newsletter"
+                        )
                 except Exception as e:
                     logger.error(f"Error saving {summary_type} newsletter content: {e}")
 
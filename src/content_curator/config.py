@@ -1,6 +1,6 @@
 import os
 from pathlib import Path
-from typing import Any, List
+from typing import Any, List, Optional
 
 import yaml
 from dotenv import load_dotenv
@@ -77,6 +77,16 @@ class Config:
         """Get the S3 bucket name."""
         return self.get("aws", "s3", "bucket_name", default="content-curator")
 
+    @property
+    def s3_max_pool_connections(self) -> int:
+        """Get the maximum number of pooled connections for the pipeline's S3 client."""
+        return self.get("aws", "s3", "max_pool_connections", default=32)
+
+    @property
+    def dynamodb_max_pool_connections(self) -> int:
+        """Get the maximum number of pooled connections for the pipeline's DynamoDB client."""
+        return self.get("aws", "dynamodb", "max_pool_connections", default=16)
+
     @property
     def dynamodb_table_name(self) -> str:
         """Get DynamoDB table name."""
@@ -84,6 +94,11 @@ class Config:
             "aws", "dynamodb", "table_name", default="content-curator-metadata"
         )
 
+    @property
+    def dynamodb_admin_index_name(self) -> Optional[str]:
+        """Get the name of the optional GSI used by the admin view to list items."""
+        return self.get("aws", "dynamodb", "admin_index_name", default=None)
+
     @property
     def log_file(self) -> str:
         """Get log file path."""
@@ -131,11 +146,26 @@ class Config:
         """Get RSS default maximum items."""
         return self.get("rss", "default_max_items", default=5)
 
+    @property
+    def rss_fetch_max_workers(self) -> int:
+        """Get the maximum number of RSS feeds to fetch concurrently."""
+        return self.get("rss", "fetch_max_workers", default=8)
+
+    @property
+    def rss_fetch_max_per_host(self) -> int:
+        """Get the maximum number of RSS feeds to fetch concurrently from one host."""
+        return self.get("rss", "fetch_max_per_host", default=2)
+
     @property
     def rss_url_file(self) -> str:
         """Get RSS URL file path."""
         return self.get("rss", "rss_url_file", default="data/rss_urls.txt")
 
+    @property
+    def processor_conversion_workers(self) -> int:
+        """Get the number of worker processes for HTML to Markdown conversion."""
+        return self.get("processor", "conversion_workers", default=1)
+
     @property
     def summarizer_model_name(self) -> str:
         """Get summarizer model name."""
@@ -146,6 +176,16 @@ class Config:
         """Get default summary types."""
         return self.get("summarizer", "default_summary_types", default=["brief"])
 
+    @property
+    def summarizer_max_concurrency(self) -> int:
+        """Get the maximum number of concurrent summarization requests."""
+        return self.get("summarizer", "max_concurrency", default=4)
+
+    @property
+    def summarizer_requests_per_minute(self) -> Optional[int]:
+        """Get the maximum number of summarization requests per minute (None for no limit)."""
+        return self.get("summarizer", "requests_per_minute", default=None)
+
     @property
     def curator_content_summary_types(self) -> List[str]:
         """Get the types of summaries to include in newsletters."""
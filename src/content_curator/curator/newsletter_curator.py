@@ -136,6 +136,19 @@ class NewsletterCurator:
         summary_attr = "short_summary" if summary_type == "brief" else "summary"
         path_attr = "short_summary_path" if summary_type == "brief" else "summary_path"
 
+        # Fetch the summaries that aren't already on the items from S3 concurrently
+        s3_summaries = {}
+        if self.s3_storage:
+            s3_summaries = self.s3_storage.get_contents(
+                [
+                    getattr(item, path_attr)
+                    for item in items
+                    if getattr(item, summary_attr, None)
+                    in (None, "", "No summary available")
+                    and getattr(item, path_attr, None)
+                ]
+            )
+
         for item in items:
             title = item.title or "Untitled"
             url = item.link or ""
@@ -151,8 +164,7 @@ class NewsletterCurator:
             if (not summary or summary == "No summary available") and self.s3_storage:
                 content_path = getattr(item, path_attr, None)
                 if content_path:
-                    # Get summary content from S3
-                    s3_content = self.s3_storage.get_content(content_path)
+                    s3_content = s3_summaries.get(content_path)
                     if s3_content:
                         summary = s3_content
                         # Cache it in the item
@@ -211,8 +223,9 @@ class NewsletterCurator:
             if not hasattr(item, "newsletters") or item.newsletters is None:
                 item.newsletters = []
             item.newsletters.append(newsletter_id)
-            # Update item in DynamoDB
-            self.state_manager.update_item(item)
+
+        # Record the newsletter on the stored items, without reading them back first
+        self.state_manager.add_to_newsletter(included_guids, newsletter_id)
 
         return formatted_content, included_guids
 
@@ -251,16 +264,19 @@ class NewsletterCurator:
         timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
         newsletter_id = f"newsletter_{timestamp}"
 
-        # Save the curated content to S3 with timestamp
+        # Save the curated content to S3 with timestamp, and also at a type-specific
+        # location as "latest_{summary_type}.md". The latest copy is made server-side
+        # from the timestamped object so the content is only uploaded once
         s3_key = f"curated/{newsletter_id}.md"
+        latest_key = f"curated/latest_{summary_type}.md"
         if self.s3_storage.store_content(s3_key, curated_content):
             self.logger.info(f"Newsletter saved to S3 at {s3_key}")
+            stored_latest = self.s3_storage.copy_object(s3_key, latest_key)
         else:
             self.logger.error("Failed to save newsletter to S3")
+            stored_latest = self.s3_storage.store_content(latest_key, curated_content)
 
-        # Also save at a type-specific location as "latest_{summary_type}.md"
-        latest_key = f"curated/latest_{summary_type}.md"
-        if self.s3_storage.store_content(latest_key, curated_content):
+        if stored_latest:
             self.logger.info(
                 f"Newsletter saved to S3 at {latest_key} (latest {summary_type} version)"
             )
@@ -1,7 +1,15 @@
+import json
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import List, Optional
+from email.utils import parsedate_to_datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+from urllib.parse import urlsplit
 
 import feedparser
+import requests
+from requests.adapters import HTTPAdapter
 
 from src.content_curator.config import config
 from src.content_curator.fetchers.fetcher_base import Fetcher
@@ -10,6 +18,30 @@ from src.content_curator.storage.dynamodb_state import DynamoDBState
 from src.content_curator.storage.s3_storage import S3Storage
 from src.content_curator.utils import generate_guid_for_rss_entry
 
+# Fetched metadata compared against the stored item to decide whether a re-fetched
+# item needs writing back to DynamoDB
+FETCH_METADATA_FIELDS = ("title", "link", "published_date", "source_url", "html_path")
+
+# Seconds to wait for a feed server to respond
+FEED_REQUEST_TIMEOUT = 30
+
+# S3 object holding each feed's ETag / Last-Modified validators from its last download,
+# sent back as If-None-Match / If-Modified-Since so unchanged feeds answer 304
+FEED_VALIDATORS_KEY = "cache/feed_validators.json"
+
+# Response headers kept as validators, and the request headers they are sent back as
+FEED_VALIDATOR_HEADERS = {
+    "etag": "If-None-Match",
+    "last-modified": "If-Modified-Since",
+}
+
+# Key recorded alongside a feed's validators holding the epoch time before which the
+# feed isn't requested again, from its Cache-Control max-age or Retry-After header
+FEED_NOT_BEFORE_KEY = "not-before"
+
+# Statuses whose Retry-After header asks us to back off from a feed
+FEED_RETRY_STATUSES = (429, 503)
+
 
 class RSSFetcher(Fetcher):
     """Fetcher implementation for RSS and Atom feeds."""
@@ -21,6 +53,8 @@ class RSSFetcher(Fetcher):
         specific_url: Optional[str] = None,
         s3_storage: Optional[S3Storage] = None,
         state_manager: Optional[DynamoDBState] = None,
+        max_workers: Optional[int] = None,
+        max_per_host: Optional[int] = None,
     ):
         """
         Initializes the RSS Fetcher.
@@ -31,6 +65,8 @@ class RSSFetcher(Fetcher):
             specific_url: Optional specific URL to fetch, overrides url_file_path if provided.
             s3_storage: Optional S3Storage instance for storing HTML content.
             state_manager: Optional DynamoDBState instance for managing state.
+            max_workers: Maximum number of feeds to fetch concurrently. If None, uses the configured default.
+            max_per_host: Maximum number of feeds to fetch concurrently from the same host. If None, uses the configured default.
         """
         source_identifier = (
             specific_url if specific_url else url_file_path or "direct_url"
@@ -41,6 +77,21 @@ class RSSFetcher(Fetcher):
         self.max_items = max_items or config.rss_default_max_items
         self.s3_storage = s3_storage
         self.state_manager = state_manager
+        self.max_workers = max_workers or config.rss_fetch_max_workers
+        self.max_per_host = max_per_host or config.rss_fetch_max_per_host
+
+        # Per-host semaphores, so several feeds on one host don't all hit it at once
+        self._host_limits: Dict[str, threading.Semaphore] = {}
+        self._host_limits_lock = threading.Lock()
+
+        # One session shared by the fetch threads, so connections (and TLS sessions)
+        # to the same host are reused; the pool is sized to the number of workers
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=self.max_workers, pool_maxsize=self.max_workers
+        )
+        self.session.mount("http://", adapter)
+        self.session.mount("https://", adapter)
 
     def _read_urls_from_file(self) -> List[str]:
         """Gets URLs either from file or from specific_url parameter."""
@@ -93,115 +144,414 @@ class RSSFetcher(Fetcher):
         )
         return None
 
-    def fetch_items(self, specific_id: Optional[str] = None) -> List[ContentItem]:
+    def _host_limit(self, url: str) -> threading.Semaphore:
         """
-        Fetches items from all RSS feeds listed in the file or from specific_url.
-        If s3_storage is provided, stores the HTML content in S3.
+        Get the semaphore limiting concurrent downloads from a feed URL's host.
 
         Args:
-            specific_id: Optional ID of a specific item to fetch
+            url: The feed URL
 
         Returns:
-            List of ContentItem objects representing fetched content
+            The semaphore shared by every feed on the URL's host
+        """
+        host = urlsplit(url).netloc.lower()
+        with self._host_limits_lock:
+            if host not in self._host_limits:
+                self._host_limits[host] = threading.Semaphore(self.max_per_host)
+            return self._host_limits[host]
+
+    @staticmethod
+    def _not_before(response: requests.Response) -> Optional[float]:
+        """
+        Work out when a feed may next be requested from the response's caching headers.
+
+        Args:
+            response: The feed's HTTP response
+
+        Returns:
+            Epoch time before which the feed shouldn't be requested again, or None if
+            the response doesn't say
+        """
+        delay = None
+        if response.status_code in FEED_RETRY_STATUSES:
+            retry_after = response.headers.get("retry-after", "").strip()
+            if retry_after.isdigit():
+                delay = int(retry_after)
+            elif retry_after:
+                try:
+                    delay = parsedate_to_datetime(retry_after).timestamp() - time.time()
+                except (TypeError, ValueError):
+                    pass
+        else:
+            for directive in response.headers.get("cache-control", "").split(","):
+                name, _, value = directive.strip().partition("=")
+                if name.lower() == "no-cache":
+                    return None
+                if name.lower() == "max-age" and value.strip('" ').isdigit():
+                    delay = int(value.strip('" '))
+
+        if not delay or delay <= 0:
+            return None
+        return time.time() + delay
+
+    def _load_feed_validators(self) -> Dict[str, Dict[str, str]]:
+        """
+        Load the validators recorded for each feed on previous runs from S3.
+
+        Returns:
+            Dictionary mapping feed URL to its validator response headers (empty if
+            there is no S3 storage or nothing has been recorded yet)
+        """
+        if not self.s3_storage:
+            return {}
+        content = self.s3_storage.get_content(FEED_VALIDATORS_KEY)
+        if not content:
+            return {}
+        try:
+            return json.loads(content)
+        except ValueError as e:
+            self.logger.warning(f"Ignoring unreadable feed validators: {e}")
+            return {}
+
+    def _save_feed_validators(self, validators: Dict[str, Dict[str, str]]) -> None:
+        """
+        Record the validators for each feed in S3 for the next run.
+
+        Args:
+            validators: Dictionary mapping feed URL to its validator response headers
+        """
+        if self.s3_storage:
+            self.s3_storage.store_content(
+                FEED_VALIDATORS_KEY,
+                json.dumps(validators, sort_keys=True),
+                content_type="application/json",
+            )
+
+    def _fetch_feed(
+        self,
+        url: str,
+        validators: Optional[Dict[str, str]] = None,
+        store_html: bool = True,
+    ) -> Tuple[List[ContentItem], Optional[Dict[str, str]]]:
+        """
+        Fetches and parses a single feed, storing each entry's HTML in S3 if available.
+        Errors are logged and result in an empty list, so one bad feed doesn't stop the rest.
+
+        Args:
+            url: The feed URL
+            validators: Validator headers from the feed's last download; if given, the
+                feed is requested conditionally and an unchanged feed yields no items
+            store_html: If False, leave storing the entries' HTML to the caller
+
+        Returns:
+            Tuple of the ContentItem objects for the feed's (most recent) entries and
+            the validators to record for the feed, or None to keep the old ones. With
+            items, record the validators only once the items are stored: the next run
+            sends them, and entries of a feed answered with a 304 are never seen again
+        """
+        items: List[ContentItem] = []
+        feed_validators: Optional[Dict[str, str]] = None
+        # HTML to store in S3 by path, uploaded together once the entries are parsed
+        html_to_store: Dict[str, str] = {}
+        self.logger.info(f"Processing feed: {url}")
+        try:
+            # Download the feed with the shared session (local paths are parsed directly)
+            response_validators: Dict[str, str] = {}
+            if url.startswith(("http://", "https://")):
+                not_before = float((validators or {}).get(FEED_NOT_BEFORE_KEY, 0))
+                if not_before > time.time():
+                    self.logger.info(
+                        f"Feed asked not to be re-fetched until "
+                        f"{datetime.fromtimestamp(not_before).isoformat()}: {url}"
+                    )
+                    return items, feed_validators
+                request_headers = {
+                    FEED_VALIDATOR_HEADERS[name]: value
+                    for name, value in (validators or {}).items()
+                    if name in FEED_VALIDATOR_HEADERS
+                }
+                with self._host_limit(url):
+                    response = self.session.get(
+                        url, headers=request_headers, timeout=FEED_REQUEST_TIMEOUT
+                    )
+                not_before = self._not_before(response)
+                if response.status_code in (304, *FEED_RETRY_STATUSES):
+                    # Keep the old validators, but remember when to try again
+                    if not_before:
+                        feed_validators = {
+                            **(validators or {}),
+                            FEED_NOT_BEFORE_KEY: str(not_before),
+                        }
+                    if response.status_code == 304:
+                        self.logger.info(f"Feed not modified since last fetch: {url}")
+                        return items, feed_validators
+                response.raise_for_status()
+                response_validators = {
+                    name: response.headers[name]
+                    for name in FEED_VALIDATOR_HEADERS
+                    if name in response.headers
+                }
+                if not_before:
+                    response_validators[FEED_NOT_BEFORE_KEY] = str(not_before)
+                feed_data = feedparser.parse(
+                    response.content,
+                    response_headers={
+                        # Lets feedparser resolve relative links and pick the encoding
+                        "content-location": response.url,
+                        "content-type": response.headers.get("content-type", ""),
+                    },
+                )
+            else:
+                feed_data = feedparser.parse(url)
+
+            # Check if feedparser encountered issues (bozo means potential problem)
+            if feed_data.bozo:
+                self.logger.warning(
+                    f"Feed may be malformed: {url}. Reason: {feed_data.bozo_exception}"
+                )
+
+            # Get entries and sort by published date if available
+            entries = feed_data.entries
+            if self.max_items is not None:
+                # Sort entries by published date if available, otherwise use updated date
+                entries.sort(
+                    key=lambda x: x.get(
+                        "published_parsed", x.get("updated_parsed", datetime.min)
+                    ),
+                    reverse=True,  # Most recent first
+                )
+                entries = entries[: self.max_items]
+                self.logger.info(
+                    f"Limited to {self.max_items} most recent items for feed: {url}"
+                )
+
+            self.logger.debug(f"Processing {len(entries)} entries in feed: {url}")
+
+            # Every entry in the feed was fetched at the same time
+            fetch_date = datetime.now().isoformat()
+
+            for entry in entries:
+                title = entry.get("title", "No Title Provided")
+                link = entry.get(
+                    "link", None
+                )  # Essential for fetching full page if needed later
+                published_parsed = entry.get(
+                    "published_parsed", entry.get("updated_parsed", None)
+                )
+                published_date = None
+                if published_parsed:
+                    # TODO: parse the published_parsed into a datetime object
+                    # Format to ISO 8601 string or keep as struct_time
+                    # For simplicity, let's use the raw string from feedparser if available
+                    published_date = entry.get("published", entry.get("updated"))
+
+                # Generate guid using the utility function
+                guid = generate_guid_for_rss_entry(entry, url, title)
+
+                # Extract HTML content
+                html_content = self._extract_html_content(entry)
+
+                # Define HTML path
+                html_path = f"html/{guid}.html"
+
+                if html_content:
+                    html_to_store[html_path] = html_content
+
+                # Create a ContentItem
+                item = ContentItem(
+                    guid=guid,
+                    link=link or "",  # Ensure link is never None
+                    title=title,
+                    published_date=published_date,
+                    fetch_date=fetch_date,
+                    last_updated=fetch_date,
+                    source_url=url,
+                    html_content=html_content,
+                    html_path=html_path,
+                )
+
+                items.append(item)
+
+                self.logger.info(
+                    f"Created new content item: '{item.title}' ({item.guid})"
+                )
+
+            # Store the HTML content in S3 (concurrently, and compressed: feed HTML is
+            # large and only ever read back whole) if storage is available. Items whose
+            # HTML wasn't stored don't point at it, and the feed keeps its old
+            # validators so it is downloaded (and the HTML stored) again next run
+            html_stored = True
+            if store_html and html_to_store and self.s3_storage:
+                stored = self.s3_storage.store_contents(
+                    html_to_store, content_type="text/html", compress=True
+                )
+                html_stored = all(stored.values())
+                for item in items:
+                    if not stored.get(item.html_path):
+                        item.html_path = None
+
+            if html_stored and response_validators:
+                feed_validators = response_validators
+
+        except Exception as e:
+            self.logger.error(
+                f"Failed to fetch or process feed {url}: {e}", exc_info=True
+            )
+            # Continue to the next feed URL even if one fails
+
+        return items, feed_validators
+
+    def _iter_fetched_feeds(
+        self, validators: Dict[str, Dict[str, str]], store_html: bool
+    ) -> Iterator[Tuple[str, List[ContentItem], Optional[Dict[str, str]]]]:
+        """
+        Fetches the RSS feeds listed in the file or from specific_url concurrently
+        (the work is dominated by network waits), at most max_per_host at a time from
+        any one host.
+
+        Args:
+            validators: Validator headers from the last download by feed URL; feeds
+                without any are downloaded unconditionally
+            store_html: If False, leave storing the entries' HTML to the caller
+
+        Yields:
+            Tuple of the feed URL, its items and the validators to record for it (see
+            _fetch_feed) for each feed, in feed order
         """
         feed_urls = self._read_urls_from_file()
-        all_items: List[ContentItem] = []
 
         if not feed_urls:
             self.logger.warning("No feed URLs loaded, fetch aborted.")
-            return all_items
+            return
+
+        with ThreadPoolExecutor(
+            max_workers=min(self.max_workers, len(feed_urls))
+        ) as executor:
+            yield from executor.map(
+                lambda url: (
+                    url,
+                    *self._fetch_feed(url, validators.get(url), store_html),
+                ),
+                feed_urls,
+            )
 
-        for url in feed_urls:
-            self.logger.info(f"Processing feed: {url}")
-            try:
-                # Parse the feed URL
-                feed_data = feedparser.parse(url)
+    def iter_feed_items(
+        self, conditional: bool = True, store_html: bool = True
+    ) -> Iterator[List[ContentItem]]:
+        """
+        Fetches the RSS feeds listed in the file or from specific_url, yielding each
+        feed's items as soon as it (and the feeds before it) have been fetched.
+        If s3_storage is provided, stores the HTML content in S3, and remembers each
+        feed's ETag / Last-Modified so feeds that haven't changed since the last run
+        are skipped with a 304 instead of downloaded and parsed again. Feeds whose
+        Cache-Control max-age (or Retry-After) hasn't passed aren't requested at all.
 
-                # Check if feedparser encountered issues (bozo means potential problem)
-                if feed_data.bozo:
-                    self.logger.warning(
-                        f"Feed may be malformed: {url}. Reason: {feed_data.bozo_exception}"
-                    )
+        Args:
+            conditional: If False, download every feed even if it hasn't changed
+            store_html: If False, leave storing the entries' HTML to the caller. The
+                feeds' validators are then recorded as if it was stored, so use
+                iter_fetch_and_update_state to store the items and their HTML
 
-                # Get entries and sort by published date if available
-                entries = feed_data.entries
-                if self.max_items is not None:
-                    # Sort entries by published date if available, otherwise use updated date
-                    entries.sort(
-                        key=lambda x: x.get(
-                            "published_parsed", x.get("updated_parsed", datetime.min)
-                        ),
-                        reverse=True,  # Most recent first
-                    )
-                    entries = entries[: self.max_items]
-                    self.logger.info(
-                        f"Limited to {self.max_items} most recent items for feed: {url}"
-                    )
+        Yields:
+            List of ContentItem objects for each feed, in feed order
+        """
+        validators = self._load_feed_validators()
+        new_validators: Dict[str, Dict[str, str]] = {}
 
-                self.logger.debug(f"Processing {len(entries)} entries in feed: {url}")
+        total_items = 0
+        for url, feed_items, feed_validators in self._iter_fetched_feeds(
+            validators if conditional else {}, store_html
+        ):
+            if feed_validators:
+                new_validators[url] = feed_validators
+            total_items += len(feed_items)
+            yield feed_items
 
-                for entry in entries:
-                    title = entry.get("title", "No Title Provided")
-                    link = entry.get(
-                        "link", None
-                    )  # Essential for fetching full page if needed later
-                    published_parsed = entry.get(
-                        "published_parsed", entry.get("updated_parsed", None)
-                    )
-                    published_date = None
-                    if published_parsed:
-                        # TODO: parse the published_parsed into a datetime object
-                        # Format to ISO 8601 string or keep as struct_time
-                        # For simplicity, let's use the raw string from feedparser if available
-                        published_date = entry.get("published", entry.get("updated"))
-
-                    # Generate guid using the utility function
-                    guid = generate_guid_for_rss_entry(entry, url, title)
-
-                    # Extract HTML content
-                    html_content = self._extract_html_content(entry)
-
-                    # Metadata for the item
-                    fetch_date = datetime.now().isoformat()
-
-                    # Define HTML path
-                    html_path = f"html/{guid}.html"
-
-                    # Store HTML content in S3 if storage is available
-                    if html_content and self.s3_storage:
-                        self.s3_storage.store_content(
-                            html_path, html_content, content_type="text/html"
-                        )
-                        self.logger.info(f"Stored HTML content at: {html_path}")
-
-                    # Create a ContentItem
-                    item = ContentItem(
-                        guid=guid,
-                        link=link or "",  # Ensure link is never None
-                        title=title,
-                        published_date=published_date,
-                        fetch_date=fetch_date,
-                        source_url=url,
-                        html_content=html_content,
-                        html_path=html_path,
-                    )
+        if new_validators:
+            self._save_feed_validators({**validators, **new_validators})
 
-                    all_items.append(item)
+        self.logger.info(
+            f"Finished processing feeds. Total items fetched: {total_items}"
+        )
 
-                    self.logger.info(
-                        f"Created new content item: '{item.title}' ({item.guid})"
-                    )
+    def fetch_items(self, specific_id: Optional[str] = None) -> List[ContentItem]:
+        """
+        Fetches items from all RSS feeds listed in the file or from specific_url.
+        If s3_storage is provided, stores the HTML content in S3.
+
+        Args:
+            specific_id: Optional ID of a specific item to fetch
+
+        Returns:
+            List of ContentItem objects representing fetched content
+        """
+        return [item for feed_items in self.iter_feed_items() for item in feed_items]
+
+    def iter_fetch_and_update_state(
+        self, specific_id: Optional[str] = None, overwrite_flag: bool = False
+    ) -> Iterator[List[ContentItem]]:
+        """
+        Fetch content from RSS feeds and update the state in DynamoDB and S3, yielding
+        each feed's items once they are stored so later stages can start on them while
+        the remaining feeds are fetched.
+
+        Args:
+            specific_id: Optional ID of a specific item to fetch
+            overwrite_flag: Whether to overwrite existing content
 
-            except Exception as e:
-                self.logger.error(
-                    f"Failed to fetch or process feed {url}: {e}", exc_info=True
+        Yields:
+            List of fetched ContentItem objects for each feed, in feed order
+        """
+        if not self.s3_storage or not self.state_manager:
+            self.logger.error(
+                "S3Storage and DynamoDBState are required for fetch_and_update_state"
+            )
+            return
+
+        stats = {"new": 0, "updated": 0, "unchanged": 0, "skipped": 0}
+        fetched_count = 0
+        validators = self._load_feed_validators()
+        new_validators: Dict[str, Dict[str, str]] = {}
+
+        # Overwriting re-downloads every feed, changed or not. The HTML is stored by
+        # _update_state, which knows which items already have it
+        for url, items, feed_validators in self._iter_fetched_feeds(
+            {} if overwrite_flag else validators, store_html=False
+        ):
+            if items:
+                fetched_count += len(items)
+                stored_items, all_stored = self._update_state(
+                    items, overwrite_flag, stats
                 )
-                # Continue to the next feed URL even if one fails
+                if not all_stored:
+                    # Keep the feed's old validators, so its entries are downloaded
+                    # again next run instead of being answered with a 304
+                    feed_validators = None
+                if feed_validators:
+                    new_validators[url] = feed_validators
+                if stored_items:
+                    yield stored_items
+            elif feed_validators:
+                new_validators[url] = feed_validators
+
+        if new_validators:
+            self._save_feed_validators({**validators, **new_validators})
+
+        if not fetched_count:
+            self.logger.warning("No items fetched from RSS feeds")
+            return
 
+        self.logger.info(f"--- Fetched {fetched_count} items ---")
+
+        # Log summary stats
+        if stats["skipped"] > 0:
+            self.logger.warning(
+                f"Skipped fetching HTML for {stats['skipped']} items that already had HTML content"
+            )
         self.logger.info(
-            f"Finished processing feeds. Total items fetched: {len(all_items)}"
+            f"Fetch summary: {stats['new']} new items, {stats['updated']} updated items, "
+            f"{stats['unchanged']} unchanged items, {stats['skipped']} skipped items"
         )
-        return all_items
 
     def fetch_and_update_state(
         self, specific_id: Optional[str] = None, overwrite_flag: bool = False
@@ -217,90 +567,159 @@ class RSSFetcher(Fetcher):
         Returns:
             List of fetched ContentItem objects
         """
-        if not self.s3_storage or not self.state_manager:
-            self.logger.error(
-                "S3Storage and DynamoDBState are required for fetch_and_update_state"
+        return [
+            item
+            for feed_items in self.iter_fetch_and_update_state(
+                specific_id, overwrite_flag
             )
-            return []
+            for item in feed_items
+        ]
 
-        fetched_items = []
-        skipped_items = 0
-        updated_items = 0
-        new_items = 0
+    def _update_state(
+        self,
+        items: List[ContentItem],
+        overwrite_flag: bool,
+        stats: Dict[str, int],
+    ) -> Tuple[List[ContentItem], bool]:
+        """
+        Store newly fetched items in DynamoDB, updating only the fetch metadata of
+        items that are already stored, and store the HTML of items that don't have it yet (or all of it when
+        overwriting) in S3.
 
-        # Fetch items from RSS feeds
-        items = self.fetch_items(specific_id)
-        if not items:
-            self.logger.warning("No items fetched from RSS feeds")
-            return []
+        Args:
+            items: Items fetched from a feed
+            overwrite_flag: Whether to overwrite existing content
+            stats: Running counts of new, updated, unchanged and skipped items,
+                updated in place
 
-        self.logger.info(f"--- Fetched {len(items)} items ---")
+        Returns:
+            Tuple of the stored items, in fetch order (an empty list if the write
+            failed), and whether every item was stored along with its HTML
+        """
+        results: List[ContentItem] = []  # All fetched items, in fetch order
+        to_store: List[ContentItem] = []  # New items, in fetch order
+        to_update: List[ContentItem] = []  # Stored items whose fetch metadata changed
+        html_to_store: Dict[str, str] = {}  # HTML not stored yet, by S3 path
+        stored_html_guids = set()  # Items whose HTML was stored on an earlier run
+
+        # Look up all stored items at once (BatchGetItem, 100 keys per request)
+        # rather than an item_exists + get_item round trip pair per item. If the
+        # lookup fails, skip the feed: treating stored items as new would write them
+        # whole and wipe their processing state
+        existing_items: Dict[str, Dict[str, Any]] = {}
+        try:
+            self.state_manager._batch_get_into(
+                existing_items, [item.guid for item in items]
+            )
+        except Exception as e:
+            self.logger.error(
+                f"Error looking up stored items for feed {items[0].source_url}, "
+                f"skipping it: {e}"
+            )
+            return [], False
 
         for item in items:
             # Check if item already exists
-            if self.state_manager.item_exists(item.guid):
+            existing_dict = existing_items.get(item.guid)
+            if existing_dict:
                 # Update existing item
-                existing_item = self.state_manager.get_item(item.guid)
-                if existing_item:
-                    # Check if HTML content already exists
-                    if existing_item.html_path and not overwrite_flag:
-                        self.logger.debug(
-                            f"Item {item.guid} already has HTML content at {existing_item.html_path}, will be preserved"
-                        )
-                        skipped_items += 1
-
-                    # Store the current processing state via paths
-                    md_path = existing_item.md_path
-                    summary_path = existing_item.summary_path
-                    short_summary_path = existing_item.short_summary_path
-                    is_paywall = existing_item.is_paywall
-                    to_be_summarized = existing_item.to_be_summarized
-                    newsletters = existing_item.newsletters
-
-                    # Update only fetch-related fields
-                    existing_item.title = item.title
-                    existing_item.link = item.link
-                    existing_item.published_date = item.published_date
-                    existing_item.fetch_date = item.fetch_date
-                    existing_item.source_url = item.source_url
-                    existing_item.html_path = item.html_path
-                    existing_item.last_updated = datetime.now().isoformat()
-
-                    # Only preserve processing state if not overwriting
-                    if not overwrite_flag:
-                        existing_item.md_path = md_path
-                        existing_item.summary_path = summary_path
-                        existing_item.short_summary_path = short_summary_path
-                        existing_item.is_paywall = is_paywall
-                        existing_item.to_be_summarized = to_be_summarized
-                        existing_item.newsletters = newsletters
-
-                    # Update the item in DynamoDB
-                    self.state_manager.update_item(existing_item, overwrite_flag)
-                    updated_items += 1
+                existing_item = ContentItem.from_dict(existing_dict)
+                # The HTML was just fetched, so hand it on rather than re-reading it
+                existing_item.html_content = item.html_content
+                results.append(existing_item)
+                if existing_item.html_path:
+                    stored_html_guids.add(item.guid)
+                # Check if HTML content already exists
+                if existing_item.html_path and not overwrite_flag:
                     self.logger.debug(
-                        f"Updated fetch metadata for item: {item.guid} (preserved processing paths)"
+                        f"Item {item.guid} already has HTML content at {existing_item.html_path}, will be preserved"
                     )
-                    # Add the updated item to fetched_items
-                    fetched_items.append(existing_item)
+                    stats["skipped"] += 1
+                elif item.html_content:
+                    html_to_store[item.html_path] = item.html_content
+
+                # Feeds mostly return the same entries run after run; skip the write
+                # (and leave fetch_date/last_updated alone) if nothing changed
+                if not overwrite_flag and all(
+                    getattr(existing_item, field) == getattr(item, field)
+                    for field in FETCH_METADATA_FIELDS
+                ):
+                    stats["unchanged"] += 1
+                    continue
+
+                # Update only fetch-related fields; the processing state read above
+                # is kept as is
+                existing_item.title = item.title
+                existing_item.link = item.link
+                existing_item.published_date = item.published_date
+                existing_item.fetch_date = item.fetch_date
+                existing_item.source_url = item.source_url
+                existing_item.html_path = item.html_path
+                existing_item.last_updated = item.fetch_date
+
+                # Queue the fetch metadata update (not a whole-item write, which
+                # would drop attributes set by other stages since the read above)
+                to_update.append(existing_item)
             else:
-                # Store new item
-                if self.state_manager.store_item(item):
-                    new_items += 1
-                    self.logger.debug(f"Stored new item: {item.guid}")
-                    # Add the new item to fetched_items
-                    fetched_items.append(item)
-
-        # Log summary stats
-        if skipped_items > 0:
-            self.logger.warning(
-                f"Skipped fetching HTML for {skipped_items} items that already had HTML content"
+                # Queue new item for the batched DynamoDB write
+                if item.html_content:
+                    html_to_store[item.html_path] = item.html_content
+                results.append(item)
+                to_store.append(item)
+
+        # Store the HTML first, so stored items never point at missing HTML: an item
+        # whose HTML wasn't stored (now or before) is written without html_path, so
+        # the next fetch tries again and later stages don't look for it
+        stored_html = (
+            self.s3_storage.store_contents(
+                html_to_store, content_type="text/html", compress=True
             )
-        self.logger.info(
-            f"Fetch summary: {new_items} new items, {updated_items} updated items, {skipped_items} skipped items"
+            if html_to_store
+            else {}
         )
+        all_html_stored = all(stored_html.values())
+        for item in to_store + to_update:
+            if (
+                item.html_path
+                and item.guid not in stored_html_guids
+                and not stored_html.get(item.html_path)
+            ):
+                if item.html_path in html_to_store:
+                    self.logger.error(
+                        f"Failed to store HTML for {item.guid}, storing the item without it"
+                    )
+                item.html_path = None
+
+        # Write new items with BatchWriteItem instead of one request per item, and set
+        # just the fetch metadata of stored ones with concurrent UpdateItems
+        fetch_updates = [
+            ContentItem(
+                guid=item.guid,
+                link=item.link,
+                title=item.title,
+                published_date=item.published_date,
+                fetch_date=item.fetch_date,
+                source_url=item.source_url,
+                html_path=item.html_path,
+                last_updated=item.last_updated,
+            )
+            for item in to_update
+        ]
+        stored_new = not to_store or self.state_manager.batch_store_items(to_store)
+        stored_updates = not fetch_updates or self.state_manager.batch_update_items(
+            fetch_updates, overwrite_flag=True
+        )
+        if stored_new and stored_updates:
+            new_items = len(to_store)
+            updated_items = len(to_update)
+            stats["new"] += new_items
+            stats["updated"] += updated_items
+            self.logger.debug(
+                f"Stored {new_items} new items and updated fetch metadata for {updated_items} items (preserved processing paths)"
+            )
+            return results, all_html_stored
 
-        return fetched_items
+        return [], False
 
 
 if __name__ == "__main__":
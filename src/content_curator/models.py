@@ -1,11 +1,14 @@
-from dataclasses import asdict, dataclass, field, fields
+from dataclasses import dataclass, field, fields
 from datetime import datetime
 from typing import Any, Dict, List, Literal, Optional
 
 SummaryType = Literal["standard", "brief"]
 
+# In-memory content fields, stored in S3 rather than in the item's database record
+CONTENT_FIELDS = ("html_content", "markdown_content", "summary", "short_summary")
 
-@dataclass
+
+@dataclass(slots=True)
 class ContentItem:
     """Represents a piece of content as it moves through the pipeline."""
 
@@ -24,6 +27,9 @@ class ContentItem:
     # Content quality flags (not processing state)
     is_paywall: Optional[bool] = None  # Determined during processing
     to_be_summarized: Optional[bool] = None  # Determined during processing
+    to_be_summarized_hash: Optional[str] = (
+        None  # Hash of the markdown that to_be_summarized was determined from
+    )
 
     # Content storage references (Paths/Keys in S3)
     html_path: Optional[str] = (
@@ -64,29 +70,27 @@ class ContentItem:
     def to_dict(self) -> Dict[str, Any]:
         """Convert the ContentItem to a dictionary for storage, omitting None values and
         in-memory content fields that should not be stored in the database."""
-        # Use asdict to convert to dictionary
-        item_dict = asdict(self)
-
-        # Remove in-memory content fields that shouldn't be stored
-        content_fields = [
-            "html_content",
-            "markdown_content",
-            "summary",
-            "short_summary",
-        ]
-        for field in content_fields:
-            if field in item_dict:
-                item_dict.pop(field)
-
-        # Remove None values to save storage space
-        return {k: v for k, v in item_dict.items() if v is not None}
+        # Read the stored fields directly rather than deep-copying the whole item with
+        # asdict (content fields included) and then discarding most of it
+        item_dict = {}
+        for name in STORED_FIELDS:
+            value = getattr(self, name)
+            # Remove None values to save storage space
+            if value is not None:
+                # Copy lists, as asdict did, so the dict doesn't alias the item
+                item_dict[name] = list(value) if isinstance(value, list) else value
+        return item_dict
+
+    def release_content(self) -> None:
+        """Drop the in-memory content fields, once they are stored and no longer needed."""
+        for name in CONTENT_FIELDS:
+            setattr(self, name, None)
 
     @classmethod
     def from_dict(cls, data: Dict[str, Any]) -> "ContentItem":
         """Create a ContentItem instance from a dictionary, handling missing fields."""
         # Filter the dictionary to only include fields that are part of the dataclass
-        valid_fields = {f.name for f in fields(cls)}
-        filtered_data = {k: v for k, v in data.items() if k in valid_fields}
+        filtered_data = {k: v for k, v in data.items() if k in FIELD_NAMES}
 
         return cls(**filtered_data)
 
@@ -98,3 +102,10 @@ class ContentItem:
 
         # Always update the last_updated timestamp
         self.last_updated = datetime.now().isoformat()
+
+
+# Every field of ContentItem, and those written to the item's database record
+FIELD_NAMES = frozenset(f.name for f in fields(ContentItem))
+STORED_FIELDS = tuple(
+    f.name for f in fields(ContentItem) if f.name not in CONTENT_FIELDS
+)
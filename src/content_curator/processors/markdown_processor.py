@@ -1,4 +1,7 @@
-from typing import List, Optional
+import hashlib
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, List, Optional
 
 from langchain_community.document_transformers import MarkdownifyTransformer
 from langchain_core.documents import Document
@@ -7,7 +10,62 @@ from loguru import logger
 from src.content_curator.models import ContentItem
 from src.content_curator.storage.dynamodb_state import DynamoDBState
 from src.content_curator.storage.s3_storage import S3Storage
-from src.content_curator.utils import is_paywall_or_teaser
+from src.content_curator.utils import MARKDOWN_CONTENT_MARKER, is_paywall_or_teaser
+
+# Converted markdown is cached in S3 under this prefix, keyed on a hash of the source HTML
+MARKDOWN_CACHE_PREFIX = "cache/markdown"
+# Maximum number of converted documents held in memory per processor
+MARKDOWN_CACHE_MAX_ENTRIES = 1024
+CONVERSION_FAILED_MARKER = "[Content Conversion Failed]"
+
+# Transformer used by html_to_markdown when called without one (e.g. in a worker process)
+_default_transformer: Optional[MarkdownifyTransformer] = None
+
+
+def create_markdown_transformer() -> MarkdownifyTransformer:
+    """Create the HTML to Markdown transformer with the configuration used for all content."""
+    return MarkdownifyTransformer(
+        heading_style="ATX",  # Use # style headings
+    )
+
+
+def html_to_markdown(
+    html_content: str, transformer: Optional[MarkdownifyTransformer] = None
+) -> Optional[str]:
+    """
+    Convert HTML string to Markdown using markdownify.
+    Handles potential errors during conversion. This is a module-level function so it
+    can be run in worker processes.
+
+    Args:
+        html_content: The HTML content to convert
+        transformer: The transformer to use; defaults to a per-process shared one
+
+    Returns:
+        The converted markdown content, or None if there is no HTML
+    """
+    global _default_transformer
+
+    if not html_content:
+        return None
+    if transformer is None:
+        if _default_transformer is None:
+            _default_transformer = create_markdown_transformer()
+        transformer = _default_transformer
+
+    try:
+        # Create a Document object with the HTML content
+        doc = Document(page_content=html_content)
+        # Transform the document with proper configuration
+        transformed_doc = transformer.transform_documents([doc])
+
+        # Get the transformed content and clean it
+        return transformed_doc[0].page_content.strip()
+
+    except Exception as e:
+        logger.error(f"Failed to convert HTML to Markdown: {e}", exc_info=True)
+        # Optionally return a placeholder or the original HTML if preferred
+        return CONVERSION_FAILED_MARKER
 
 
 class MarkdownProcessor:
@@ -18,6 +76,7 @@ class MarkdownProcessor:
         min_content_length: int = 500,
         s3_storage: Optional[S3Storage] = None,
         state_manager: Optional[DynamoDBState] = None,
+        conversion_workers: int = 1,
     ):
         """
         Initialize the content processor with necessary transformers.
@@ -26,15 +85,20 @@ class MarkdownProcessor:
             min_content_length: Minimum text length (in characters) to be considered worth summarizing
             s3_storage: Optional S3Storage instance for retrieving and storing content
             state_manager: Optional DynamoDBState instance for updating item state
+            conversion_workers: Number of worker processes for HTML to Markdown conversion
+                in process_and_update_state (1 converts in this process)
         """
         self.logger = logger
         self.min_content_length = min_content_length
         self.s3_storage = s3_storage
         self.state_manager = state_manager
+        self.conversion_workers = conversion_workers
         # Initialize MarkdownifyTransformer with proper configuration
-        self.md = MarkdownifyTransformer(
-            heading_style="ATX",  # Use # style headings
-        )
+        self.md = create_markdown_transformer()
+        # Converted markdown keyed on cache key (see _markdown_cache_key)
+        self._markdown_cache: Dict[str, str] = {}
+        # Created on first use and reused, as starting worker processes is slow
+        self._conversion_pool: Optional[ProcessPoolExecutor] = None
 
     def convert_html_to_markdown(self, html_content: str) -> Optional[str]:
         """
@@ -47,21 +111,117 @@ class MarkdownProcessor:
         Returns:
             The converted markdown content, or None if conversion fails
         """
+        return html_to_markdown(html_content, self.md)
+
+    def convert_many_html_to_markdown(self, html_contents: List[str]) -> Dict[str, str]:
+        """
+        Convert several HTML documents, in parallel worker processes if configured, and
+        add the results to the in-memory cache. Conversion is CPU-bound, so threads
+        would not help; S3 and DynamoDB access stays in this process.
+
+        Args:
+            html_contents: The HTML contents to convert (already cached ones are skipped)
+
+        Returns:
+            Dictionary mapping cache key to markdown for each successful new conversion
+        """
+        pending: Dict[str, str] = {}
+        for html_content in html_contents:
+            if not html_content:
+                continue
+            cache_key = self._markdown_cache_key(html_content)
+            if cache_key not in self._markdown_cache:
+                pending[cache_key] = html_content
+        if not pending:
+            return {}
+
+        results = None
+        if self.conversion_workers > 1 and len(pending) > 1:
+            try:
+                if self._conversion_pool is None:
+                    # Spawn rather than fork: the pipeline calls this from worker threads
+                    self._conversion_pool = ProcessPoolExecutor(
+                        max_workers=self.conversion_workers,
+                        mp_context=multiprocessing.get_context("spawn"),
+                    )
+                chunksize = max(1, len(pending) // (self.conversion_workers * 4))
+                results = list(
+                    self._conversion_pool.map(
+                        html_to_markdown, pending.values(), chunksize=chunksize
+                    )
+                )
+            except Exception as e:
+                self.logger.warning(
+                    f"Parallel HTML to Markdown conversion failed, converting in-process: {e}"
+                )
+                self.close()
+        if results is None:
+            results = map(self.convert_html_to_markdown, pending.values())
+
+        converted: Dict[str, str] = {}
+        for cache_key, markdown_content in zip(pending, results):
+            # Don't cache failures so they are retried on the next run
+            if markdown_content and markdown_content != CONVERSION_FAILED_MARKER:
+                self._cache_markdown(cache_key, markdown_content)
+                converted[cache_key] = markdown_content
+        return converted
+
+    def close(self) -> None:
+        """Shut down the conversion worker processes, if any were started."""
+        if self._conversion_pool is not None:
+            self._conversion_pool.shutdown(cancel_futures=True)
+            self._conversion_pool = None
+
+    @staticmethod
+    def _markdown_cache_key(html_content: str) -> str:
+        """
+        Build the content-addressed cache key for the markdown converted from some HTML.
+
+        Args:
+            html_content: The HTML content to be converted
+
+        Returns:
+            The S3 key under which the converted markdown is cached
+        """
+        content_hash = hashlib.sha256(html_content.encode("utf-8")).hexdigest()
+        return f"{MARKDOWN_CACHE_PREFIX}/{content_hash}.md"
+
+    def _cache_markdown(self, cache_key: str, markdown_content: str) -> None:
+        """
+        Add converted markdown to the in-memory cache, evicting the oldest entry when full.
+
+        Args:
+            cache_key: The cache key for the source HTML
+            markdown_content: The converted markdown content
+        """
+        if len(self._markdown_cache) >= MARKDOWN_CACHE_MAX_ENTRIES:
+            self._markdown_cache.pop(next(iter(self._markdown_cache)))
+        self._markdown_cache[cache_key] = markdown_content
+
+    def convert_html_to_markdown_cached(self, html_content: str) -> Optional[str]:
+        """
+        Convert HTML to Markdown, reusing a previous conversion of identical HTML if cached.
+        Conversion is deterministic in its input, so cached results are never stale.
+
+        Args:
+            html_content: The HTML content to convert
+
+        Returns:
+            The converted markdown content, or None if there is no HTML
+        """
         if not html_content:
             return None
-        try:
-            # Create a Document object with the HTML content
-            doc = Document(page_content=html_content)
-            # Transform the document with proper configuration
-            transformed_doc = self.md.transform_documents([doc])
 
-            # Get the transformed content and clean it
-            return transformed_doc[0].page_content.strip()
+        cache_key = self._markdown_cache_key(html_content)
+        cached = self._markdown_cache.get(cache_key)
+        if cached is not None:
+            return cached
 
-        except Exception as e:
-            self.logger.error(f"Failed to convert HTML to Markdown: {e}", exc_info=True)
-            # Optionally return a placeholder or the original HTML if preferred
-            return "[Content Conversion Failed]"
+        markdown_content = self.convert_html_to_markdown(html_content)
+        # Don't cache failures so they are retried on the next run
+        if markdown_content and markdown_content != CONVERSION_FAILED_MARKER:
+            self._cache_markdown(cache_key, markdown_content)
+        return markdown_content
 
     def format_content(self, item: ContentItem, markdown_content: str) -> str:
         """
@@ -79,7 +239,7 @@ class MarkdownProcessor:
         fetch_date = item.fetch_date or "Unknown"
         published_date = item.published_date or "Unknown"
 
-        header = f"Date Updated: {fetch_date}\nDate Published: {published_date}\n\nTitle: {title}\n\nURL Source: {link}\n\nMarkdown Content:\n"
+        header = f"Date Updated: {fetch_date}\nDate Published: {published_date}\n\nTitle: {title}\n\nURL Source: {link}\n\n{MARKDOWN_CONTENT_MARKER}"
         return header + markdown_content
 
     def process_content(self, items: List[ContentItem]) -> List[ContentItem]:
@@ -100,7 +260,7 @@ class MarkdownProcessor:
 
             # Convert HTML to Markdown
             markdown_content = (
-                self.convert_html_to_markdown(html_content)
+                self.convert_html_to_markdown_cached(html_content)
                 if html_content
                 else "[No Content Found]"
             )
@@ -163,6 +323,24 @@ class MarkdownProcessor:
             guid=item.guid, path_formats=path_formats, configured_path=item.md_path
         )
 
+    def _check_markdowns_at_paths(self, items: List[ContentItem]) -> List[bool]:
+        """
+        Check if markdown content exists for several items, with the S3 lookups for
+        all items made concurrently.
+
+        Args:
+            items: The ContentItems to check
+
+        Returns:
+            True if markdown exists, False otherwise, for each item in order
+        """
+        if not items or not self.s3_storage:
+            return [False] * len(items)
+        with ThreadPoolExecutor(
+            max_workers=min(self.s3_storage.max_pool_connections, len(items))
+        ) as executor:
+            return list(executor.map(self._check_markdown_at_paths, items))
+
     def process_and_update_state(
         self,
         items_to_process: List[ContentItem],
@@ -190,10 +368,16 @@ class MarkdownProcessor:
         skipped_no_html = 0
         successfully_processed = 0
 
-        for item in items_to_process:
-            # Check if markdown content already exists across possible paths
-            has_markdown = self._check_markdown_at_paths(item)
+        # Check if markdown content already exists across possible paths (there's no
+        # need to look when overwriting, as every item is processed again)
+        markdown_checks = (
+            [False] * len(items_to_process)
+            if overwrite_flag
+            else self._check_markdowns_at_paths(items_to_process)
+        )
 
+        items_needing_processing = []
+        for item, has_markdown in zip(items_to_process, markdown_checks):
             # Skip already processed items unless overwrite is enabled
             if has_markdown and not overwrite_flag:
                 self.logger.info(
@@ -203,9 +387,21 @@ class MarkdownProcessor:
                 skipped_already_processed += 1
                 continue
 
-            # Fetch HTML content from S3 if not already loaded
+            items_needing_processing.append(item)
+
+        # Fetch HTML content from S3 concurrently for items that don't have it loaded
+        html_contents = self.s3_storage.get_contents(
+            [
+                item.html_path
+                for item in items_needing_processing
+                if not item.html_content and item.html_path
+            ]
+        )
+
+        items_with_html = []
+        for item in items_needing_processing:
             if not item.html_content and item.html_path:
-                html_content = self.s3_storage.get_content(item.html_path)
+                html_content = html_contents.get(item.html_path)
                 if html_content:
                     item.html_content = html_content
                 else:
@@ -215,35 +411,86 @@ class MarkdownProcessor:
                     skipped_no_html += 1
                     continue
 
+            items_with_html.append(item)
+
+        # Load previously converted markdown for identical HTML from the S3 cache
+        cache_keys = {
+            item.guid: self._markdown_cache_key(item.html_content)
+            for item in items_with_html
+            if item.html_content
+        }
+        cached_markdown = self.s3_storage.get_contents(
+            [key for key in set(cache_keys.values()) if key not in self._markdown_cache]
+        )
+        cache_hits = 0
+        for cache_key, markdown_content in cached_markdown.items():
+            if markdown_content:
+                self._cache_markdown(cache_key, markdown_content)
+                cache_hits += 1
+        if cache_hits:
+            self.logger.info(f"Loaded {cache_hits} converted documents from cache")
+
+        # Convert the remaining HTML up front (in parallel if configured)
+        new_cache_entries = self.convert_many_html_to_markdown(
+            [item.html_content for item in items_with_html]
+        )
+
+        markdown_to_store: Dict[str, ContentItem] = {}
+        for item in items_with_html:
+            cache_key = cache_keys.get(item.guid)
+            was_cached = cache_key in self._markdown_cache
+
             # Process the item (convert HTML to markdown)
             processed_item = self.process_item(item)
+            if not was_cached and cache_key in self._markdown_cache:
+                new_cache_entries[cache_key] = self._markdown_cache[cache_key]
 
-            # Check if we need to store the markdown content
+            # Queue the markdown content for storage
             if processed_item.markdown_content:
                 s3_key = item.md_path if item.md_path else f"markdown/{item.guid}.md"
-
-                # Store markdown content in S3 if we're overwriting or it's a new file
-                if self.s3_storage.store_content(
-                    s3_key, processed_item.markdown_content
-                ):
-                    # Only set the md_path if it's not already set
-                    if not processed_item.md_path:
-                        processed_item.md_path = s3_key
-
-                    # Update the item in DynamoDB - will now preserve existing fields
-                    self.state_manager.update_item(processed_item, overwrite_flag)
-                    self.logger.info(
-                        f"Updated item '{processed_item.title}' ({processed_item.guid}): stored markdown content at {s3_key}"
-                    )
-                    processed_items.append(processed_item)
-                    successfully_processed += 1
-                else:
-                    self.logger.error(
-                        f"Failed to store markdown content for {processed_item.guid}"
-                    )
+                markdown_to_store[s3_key] = processed_item
             else:
                 self.logger.info(f"No markdown content generated for {item.guid}")
 
+        # Store markdown content in S3 concurrently, gzip-compressed: get_content and
+        # get_content_range decompress it, and markdown shrinks several times over
+        stored = self.s3_storage.store_contents(
+            {
+                s3_key: processed_item.markdown_content
+                for s3_key, processed_item in markdown_to_store.items()
+            },
+            compress=True,
+        )
+        items_to_update = []
+        for s3_key, processed_item in markdown_to_store.items():
+            if not stored.get(s3_key):
+                self.logger.error(
+                    f"Failed to store markdown content for {processed_item.guid}"
+                )
+                continue
+
+            # Only set the md_path if it's not already set
+            if not processed_item.md_path:
+                processed_item.md_path = s3_key
+            items_to_update.append(processed_item)
+
+        # Update the items in DynamoDB in one batch - preserves existing fields
+        if self.state_manager.batch_update_items(items_to_update, overwrite_flag):
+            for processed_item in items_to_update:
+                self.logger.info(
+                    f"Updated item '{processed_item.title}' ({processed_item.guid}): stored markdown content at {processed_item.md_path}"
+                )
+                processed_items.append(processed_item)
+                successfully_processed += 1
+        else:
+            self.logger.error(
+                f"Failed to update {len(items_to_update)} processed items in DynamoDB"
+            )
+
+        # Store newly converted markdown so identical HTML isn't converted again
+        if new_cache_entries:
+            self.s3_storage.store_contents(new_cache_entries, compress=True)
+
         # Log summary stats
         total_skipped = skipped_already_processed + skipped_no_html
         if total_skipped > 0:
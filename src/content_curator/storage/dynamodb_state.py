@@ -1,22 +1,58 @@
+import copy
+import itertools
+import queue
+import random
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Any, Dict, List, Literal, Optional, Union
+from typing import Any, Dict, Iterator, List, Literal, Optional, Union
 
 import boto3
+from boto3.dynamodb.conditions import Attr, Key
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from loguru import logger
 
 from src.content_curator.models import ContentItem
 
 
+# For each stage that can be re-run with overwrite: the path its input must have, and
+# the path it writes (so items without it still need the stage)
+STAGE_TARGET_PATHS = {
+    "process": ("html_path", "md_path"),
+    "summarize": ("md_path", "summary_path"),
+}
+
+
 class DynamoDBState:
     """
     Handles DynamoDB operations for managing content curation state and metadata.
     """
 
+    # Every written item is stamped with this constant partition key so an optional
+    # GSI (partition key ADMIN_INDEX_KEY, sort key last_updated) can list all items
+    # with a Query instead of a full-table Scan
+    ADMIN_INDEX_KEY = "admin_view_pk"
+    ADMIN_INDEX_KEY_VALUE = "ALL"
+
+    # Most items kept by the item cache; the least recently used are dropped first
+    ITEM_CACHE_MAX_SIZE = 2048
+
+    # Keys or items a batch request leaves unprocessed (throttling) are resubmitted
+    # after an exponential backoff with full jitter, at most this many times
+    BATCH_RETRY_MAX_ATTEMPTS = 8
+    BATCH_RETRY_BASE_DELAY = 0.05  # seconds
+    BATCH_RETRY_MAX_DELAY = 5.0  # seconds
+
     def __init__(
         self,
         dynamodb_table_name: str,
         aws_region: str = "us-east-1",
+        botocore_config: Optional[Config] = None,
+        cache_items: bool = False,
+        session: Optional[boto3.Session] = None,
     ):
         """
         Initialize DynamoDB state manager.
@@ -24,14 +60,92 @@ class DynamoDBState:
         Args:
             dynamodb_table_name: Name of the DynamoDB table
             aws_region: AWS region to use
+            botocore_config: Optional botocore Config (e.g. a larger connection pool
+                for concurrent callers)
+            cache_items: If True, remember items read or written through this instance
+                so repeated get_item calls for the same GUID (e.g. once per pipeline
+                stage) don't each cost a GetItem. Only safe while no other writer is
+                changing the same items; call clear_item_cache() between runs
+            session: Optional boto3 Session to create the resource from, so several
+                clients share one credential lookup (defaults to the global session)
         """
         self.dynamodb_table_name = dynamodb_table_name
         self.aws_region = aws_region
 
         # Initialize DynamoDB resource
-        self.dynamodb = boto3.resource("dynamodb", region_name=aws_region)
+        self.dynamodb = (session or boto3).resource(
+            "dynamodb", region_name=aws_region, config=botocore_config
+        )
         self.table = self.dynamodb.Table(dynamodb_table_name)
         self.logger = logger
+        # Raw stored items by GUID in least-recently-used order, or None if caching
+        # is disabled. The stages share this instance across threads, so every access
+        # to the cache holds _item_cache_lock
+        self._item_cache: Optional[OrderedDict[str, Dict[str, Any]]] = (
+            OrderedDict() if cache_items else None
+        )
+        self._item_cache_lock = threading.Lock()
+        # Number of writes made to each GUID through this instance. A read only caches
+        # its result if no write to the item finished while it was in flight, so a
+        # read racing a write can't re-cache the item as it was before the write
+        self._item_generations: Dict[str, int] = {}
+
+    def clear_item_cache(self) -> None:
+        """Forget all cached items (a no-op if caching is disabled)."""
+        if self._item_cache is not None:
+            with self._item_cache_lock:
+                self._item_cache.clear()
+
+    def _cached_item(self, guid: str) -> Optional[Dict[str, Any]]:
+        """Return a copy of the cached stored state of an item, or None if not cached."""
+        if self._item_cache is None:
+            return None
+        with self._item_cache_lock:
+            item_dict = self._item_cache.get(guid)
+            if item_dict is None:
+                return None
+            self._item_cache.move_to_end(guid)
+        # Cached dicts are replaced, never changed in place, so copy outside the lock
+        return copy.deepcopy(item_dict)
+
+    def _item_generation(self, guid: str) -> int:
+        """Return the write generation of an item, to pass to _cache_item after a read."""
+        with self._item_cache_lock:
+            return self._item_generations.get(guid, 0)
+
+    def _cache_item(
+        self, item_dict: Dict[str, Any], generation: Optional[int] = None
+    ) -> None:
+        """
+        Remember the stored state of an item, if caching is enabled.
+
+        Args:
+            item_dict: The stored item
+            generation: For an item that was read, the item's write generation from
+                before the read; the item is only cached if no write has finished
+                since. None for an item that was just written, which supersedes
+                anything read before
+        """
+        if self._item_cache is not None:
+            item_copy = copy.deepcopy(item_dict)
+            guid = item_copy["guid"]
+            with self._item_cache_lock:
+                current_generation = self._item_generations.get(guid, 0)
+                if generation is None:
+                    self._item_generations[guid] = current_generation + 1
+                elif generation != current_generation:
+                    return
+                self._item_cache[guid] = item_copy
+                self._item_cache.move_to_end(guid)
+                while len(self._item_cache) > self.ITEM_CACHE_MAX_SIZE:
+                    self._item_cache.popitem(last=False)
+
+    def _uncache_item(self, guid: str) -> None:
+        """Forget an item after a write that changed its stored state (or may have)."""
+        if self._item_cache is not None:
+            with self._item_cache_lock:
+                self._item_cache.pop(guid, None)
+                self._item_generations[guid] = self._item_generations.get(guid, 0) + 1
 
     def check_resources_exist(self) -> bool:
         """
@@ -48,6 +162,293 @@ class DynamoDBState:
             )
             return False
 
+    def describe_table(self) -> Dict[str, Any]:
+        """
+        Get the table description (size, item count, indexes) from DynamoDB.
+
+        Returns:
+            The 'Table' section of the DescribeTable response
+        """
+        response = self.table.meta.client.describe_table(
+            TableName=self.dynamodb_table_name
+        )
+        return response["Table"]
+
+    def _get_total_segments(self, min_segments: int = 4, max_segments: int = 16) -> int:
+        """
+        Choose the number of parallel scan segments from the table size (~1 segment per MB).
+
+        Args:
+            min_segments: Lower bound on the number of segments
+            max_segments: Upper bound on the number of segments
+
+        Returns:
+            Number of segments to use for a parallel scan
+        """
+        try:
+            table_size_bytes = self.describe_table().get("TableSizeBytes", 0)
+        except Exception as e:
+            self.logger.warning(
+                f"Could not describe table {self.dynamodb_table_name}, using {min_segments} scan segments: {e}"
+            )
+            return min_segments
+
+        return max(min_segments, min(max_segments, table_size_bytes // (1024 * 1024)))
+
+    def _scan_segment(
+        self, segment: int, total_segments: int, scan_kwargs: Dict[str, Any]
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan a single segment of the table, following pagination until it is exhausted.
+
+        Args:
+            segment: Index of the segment to scan
+            total_segments: Total number of segments the table is split into
+            scan_kwargs: Extra keyword arguments passed to every scan call
+
+        Returns:
+            List of raw items in this segment
+        """
+        return list(
+            self._iter_scan(
+                Segment=segment, TotalSegments=total_segments, **scan_kwargs
+            )
+        )
+
+    def _iter_scan_pages(self, **scan_kwargs) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Scan the table page by page, following LastEvaluatedKey until it is exhausted.
+
+        Args:
+            **scan_kwargs: Extra keyword arguments passed to every scan call
+
+        Yields:
+            The raw items of each scan page
+        """
+        while True:
+            response = self.table.scan(**scan_kwargs)
+            yield response.get("Items", [])
+            start_key = response.get("LastEvaluatedKey")
+            if not start_key:
+                return
+            scan_kwargs["ExclusiveStartKey"] = start_key
+
+    @staticmethod
+    def _prefetch_pages(
+        pages: Iterator[List[Dict[str, Any]]], max_prefetched: int = 2
+    ) -> Iterator[List[Dict[str, Any]]]:
+        """
+        Request pages on a background thread so the next Scan is in flight while the
+        caller works through the current page.
+
+        At most max_prefetched pages are buffered ahead of the caller. If the caller
+        stops early the background thread stops after its in-flight request, and any
+        error raised while scanning is re-raised to the caller.
+
+        Args:
+            pages: Page iterator to drain on the background thread
+            max_prefetched: Maximum number of pages buffered ahead of the caller
+
+        Yields:
+            The pages of the underlying iterator, in order
+        """
+        buffer: queue.Queue = queue.Queue(maxsize=max_prefetched)
+        stopped = threading.Event()
+        done = object()
+
+        def put(entry: Any) -> bool:
+            # Block until the caller makes room, giving up if it has stopped reading
+            while not stopped.is_set():
+                try:
+                    buffer.put(entry, timeout=0.1)
+                    return True
+                except queue.Full:
+                    continue
+            return False
+
+        def produce() -> None:
+            try:
+                for page in pages:
+                    if not put(page):
+                        return
+            except Exception as e:
+                put(e)
+                return
+            put(done)
+
+        producer = threading.Thread(
+            target=produce, name="dynamodb-scan-prefetch", daemon=True
+        )
+        producer.start()
+        try:
+            while True:
+                entry = buffer.get()
+                if entry is done:
+                    return
+                if isinstance(entry, Exception):
+                    raise entry
+                yield entry
+        finally:
+            stopped.set()
+
+    def _iter_scan(
+        self, limit: Optional[int] = None, prefetch: bool = False, **scan_kwargs
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Lazily scan the table, requesting each page only once the previous one is consumed.
+
+        Unlike the scan Limit parameter, which caps the number of items *evaluated* per
+        page (before any FilterExpression), limit here caps the number of matching items
+        yielded, following pagination until it is reached or the table is exhausted.
+
+        Args:
+            limit: Maximum number of items to yield (None for no limit)
+            prefetch: If True, request the next page on a background thread while the
+                caller consumes the current one. This may cost one extra Scan call
+                when limit is reached part-way through the table
+            **scan_kwargs: Extra keyword arguments passed to every scan call
+
+        Yields:
+            Raw items from the table
+        """
+        if limit is not None and limit <= 0:
+            return
+
+        pages = self._iter_scan_pages(**scan_kwargs)
+        if prefetch:
+            pages = self._prefetch_pages(pages)
+
+        yielded = 0
+        try:
+            for page in pages:
+                for item in page:
+                    yield item
+                    yielded += 1
+                    if limit is not None and yielded >= limit:
+                        return
+        finally:
+            # Stop the prefetch thread promptly rather than at garbage collection
+            pages.close()
+
+    @staticmethod
+    def _projection_kwargs(attributes: List[str]) -> Dict[str, Any]:
+        """
+        Build ProjectionExpression kwargs for a list of attribute names.
+        Attribute names are always aliased so reserved words (e.g. 'link') are escaped.
+
+        Args:
+            attributes: Attribute names to return
+
+        Returns:
+            Keyword arguments for a scan, query or get_item call
+        """
+        attribute_names = {f"#p{i}": name for i, name in enumerate(attributes)}
+        return {
+            "ProjectionExpression": ", ".join(attribute_names),
+            "ExpressionAttributeNames": attribute_names,
+        }
+
+    def parallel_scan(
+        self,
+        total_segments: Optional[int] = None,
+        projection: Optional[List[str]] = None,
+        **scan_kwargs: Any,
+    ) -> List[Dict[str, Any]]:
+        """
+        Scan the whole table using DynamoDB's parallel scan (Segment/TotalSegments).
+        Each segment is paginated in its own worker thread and the results are concatenated.
+
+        Args:
+            total_segments: Number of segments to split the scan into. If None, it is derived
+                            from the table size (clamped to between 4 and 16)
+            projection: Optional list of attribute names to return instead of whole items
+            **scan_kwargs: Extra keyword arguments passed to every scan call
+                           (e.g. FilterExpression)
+
+        Returns:
+            List of raw items (dictionaries) in the table
+
+        Raises:
+            ClientError: If any of the segment scans fail
+        """
+        total_segments = total_segments or self._get_total_segments()
+        if projection:
+            scan_kwargs.update(self._projection_kwargs(projection))
+
+        with ThreadPoolExecutor(max_workers=total_segments) as executor:
+            segment_items = executor.map(
+                lambda segment: self._scan_segment(
+                    segment, total_segments, scan_kwargs
+                ),
+                range(total_segments),
+            )
+            items = list(itertools.chain.from_iterable(segment_items))
+
+        self.logger.debug(
+            f"Parallel scan of {self.dynamodb_table_name} returned {len(items)} items from {total_segments} segments"
+        )
+        return items
+
+    def query_admin_index(
+        self, index_name: str, projection: Optional[List[str]] = None
+    ) -> List[Dict[str, Any]]:
+        """
+        List all items through the admin GSI (see ADMIN_INDEX_KEY), newest first.
+        Only items stamped with the admin index key and having a last_updated value
+        are in the index.
+
+        Args:
+            index_name: Name of the GSI on ADMIN_INDEX_KEY / last_updated
+            projection: Optional list of attribute names to return instead of whole items
+
+        Returns:
+            List of raw items (dictionaries) in the index
+
+        Raises:
+            ClientError: If the query fails (e.g. the index does not exist)
+        """
+        query_kwargs: Dict[str, Any] = {
+            "IndexName": index_name,
+            "KeyConditionExpression": Key(self.ADMIN_INDEX_KEY).eq(
+                self.ADMIN_INDEX_KEY_VALUE
+            ),
+            "ScanIndexForward": False,
+        }
+        if projection:
+            query_kwargs.update(self._projection_kwargs(projection))
+
+        items = []
+        while True:
+            response = self.table.query(**query_kwargs)
+            items.extend(response.get("Items", []))
+            start_key = response.get("LastEvaluatedKey")
+            if not start_key:
+                break
+            query_kwargs["ExclusiveStartKey"] = start_key
+
+        self.logger.debug(
+            f"Query of index {index_name} on {self.dynamodb_table_name} returned {len(items)} items"
+        )
+        return items
+
+    def backfill_admin_index_key(self) -> int:
+        """
+        Stamp the admin index key on items written before it was introduced.
+
+        Returns:
+            Number of items updated
+        """
+        items = self.parallel_scan(
+            projection=["guid"],
+            FilterExpression=Attr(self.ADMIN_INDEX_KEY).not_exists(),
+        )
+        updated = 0
+        for item in items:
+            if self.update_metadata(item["guid"], {}):
+                updated += 1
+        self.logger.info(f"Stamped admin index key on {updated} items")
+        return updated
+
     def store_item(self, item: ContentItem) -> bool:
         """
         Store ContentItem in DynamoDB.
@@ -61,14 +462,54 @@ class DynamoDBState:
         try:
             # Convert ContentItem to dictionary for DynamoDB
             item_dict = item.to_dict()
-
-            self.table.put_item(Item=item_dict)
+            item_dict[self.ADMIN_INDEX_KEY] = self.ADMIN_INDEX_KEY_VALUE
+
+            try:
+                self.table.put_item(Item=item_dict)
+            except Exception:
+                self._uncache_item(item.guid)
+                raise
+            self._cache_item(item_dict)
             self.logger.info(f"Stored item with GUID: {item.guid}")
             return True
         except Exception as e:
             self.logger.error(f"Error storing item: {e}")
             return False
 
+    def batch_store_items(self, items: List[ContentItem]) -> bool:
+        """
+        Store many ContentItems with BatchWriteItem (25 puts per request).
+        Each item is written whole, replacing any stored item with the same GUID.
+
+        Args:
+            items: The ContentItems to store
+
+        Returns:
+            True if all items were stored, False otherwise
+        """
+        if not items:
+            return True
+        try:
+            # batch_writer chunks the puts and resubmits unprocessed items;
+            # overwrite_by_pkeys drops duplicate GUIDs within a batch (last one wins)
+            item_dicts = []
+            with self.table.batch_writer(overwrite_by_pkeys=["guid"]) as batch:
+                for item in items:
+                    item_dict = item.to_dict()
+                    item_dict[self.ADMIN_INDEX_KEY] = self.ADMIN_INDEX_KEY_VALUE
+                    batch.put_item(Item=item_dict)
+                    item_dicts.append(item_dict)
+            for item_dict in item_dicts:
+                self._cache_item(item_dict)
+            self.logger.info(f"Batch-stored {len(items)} items")
+            return True
+        except Exception as e:
+            # Some of the puts may have gone through
+            for item in items:
+                self._uncache_item(item.guid)
+            self.logger.error(f"Error batch-storing items: {e}")
+            return False
+
     def store_metadata(self, metadata: Dict[str, Any]) -> bool:
         """
         Store metadata in DynamoDB.
@@ -80,7 +521,12 @@ class DynamoDBState:
             True if successful, False otherwise
         """
         try:
-            self.table.put_item(Item=metadata)
+            try:
+                self.table.put_item(
+                    Item={**metadata, self.ADMIN_INDEX_KEY: self.ADMIN_INDEX_KEY_VALUE}
+                )
+            finally:
+                self._uncache_item(metadata.get("guid"))
             self.logger.info(
                 f"Stored metadata for item with GUID: {metadata.get('guid')}"
             )
@@ -100,18 +546,106 @@ class DynamoDBState:
             ContentItem or None if not found
         """
         try:
+            cached = self._cached_item(guid)
+            if cached is not None:
+                return ContentItem.from_dict(cached)
+
+            generation = self._item_generation(guid)
             response = self.table.get_item(Key={"guid": guid})
             item_dict = response.get("Item")
 
             if not item_dict:
                 return None
 
+            self._cache_item(item_dict, generation)
+
             # Convert dictionary to ContentItem
             return ContentItem.from_dict(item_dict)
         except Exception as e:
             self.logger.error(f"Error retrieving item {guid}: {e}")
             return None
 
+    def batch_get_items(
+        self, guids: List[str], projection: Optional[List[str]] = None
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Retrieve many items with BatchGetItem (up to 100 keys per request).
+
+        Args:
+            guids: The unique identifiers of the items
+            projection: Optional list of attribute names to return instead of whole items
+                        (include 'guid' to key the results)
+
+        Returns:
+            Dictionary mapping each found GUID to its raw item; missing items are omitted
+        """
+        items: Dict[str, Dict[str, Any]] = {}
+        try:
+            self._batch_get_into(items, guids, projection)
+        except Exception as e:
+            self.logger.error(f"Error batch-retrieving items: {e}")
+        return items
+
+    def _batch_get_into(
+        self,
+        items: Dict[str, Dict[str, Any]],
+        guids: List[str],
+        projection: Optional[List[str]] = None,
+    ) -> None:
+        """
+        Retrieve many items with BatchGetItem into items (keyed by GUID), raising on
+        errors so callers can tell a partial result from missing items.
+
+        Args:
+            items: Dictionary to add the retrieved raw items to
+            guids: The unique identifiers of the items
+            projection: Optional list of attribute names to return instead of whole items
+        """
+        unique_guids = list(dict.fromkeys(guids))
+        for start in range(0, len(unique_guids), 100):
+            keys_and_attributes: Dict[str, Any] = {
+                "Keys": [{"guid": guid} for guid in unique_guids[start : start + 100]]
+            }
+            if projection:
+                keys_and_attributes.update(self._projection_kwargs(projection))
+            request_items = {self.dynamodb_table_name: keys_and_attributes}
+
+            # DynamoDB may return some keys unprocessed under load; resubmit them
+            # after backing off, so a throttled table isn't hammered
+            for attempt in range(self.BATCH_RETRY_MAX_ATTEMPTS + 1):
+                if attempt:
+                    self._batch_retry_backoff(attempt)
+                response = self.dynamodb.batch_get_item(RequestItems=request_items)
+                for item in response["Responses"].get(self.dynamodb_table_name, []):
+                    items[item["guid"]] = item
+                request_items = response.get("UnprocessedKeys")
+                if not request_items:
+                    break
+            else:
+                raise RuntimeError(
+                    f"{len(request_items[self.dynamodb_table_name]['Keys'])} keys "
+                    f"still unprocessed after {self.BATCH_RETRY_MAX_ATTEMPTS} retries"
+                )
+
+        self.logger.debug(f"Batch-retrieved {len(items)} of {len(unique_guids)} items")
+
+    def _batch_retry_backoff(self, attempt: int) -> None:
+        """
+        Sleep before resubmitting the unprocessed part of a batch request.
+
+        Args:
+            attempt: The number of the retry about to be made, starting at 1
+        """
+        delay = random.uniform(
+            0,
+            min(
+                self.BATCH_RETRY_MAX_DELAY,
+                self.BATCH_RETRY_BASE_DELAY * 2 ** (attempt - 1),
+            ),
+        )
+        self.logger.debug(f"Batch request throttled, retrying in {delay:.2f}s")
+        time.sleep(delay)
+
     def get_metadata(self, guid: str) -> Optional[Dict[str, Any]]:
         """
         Retrieve item metadata from DynamoDB.
@@ -123,8 +657,15 @@ class DynamoDBState:
             Item metadata or None if not found
         """
         try:
+            cached = self._cached_item(guid)
+            if cached is not None:
+                return cached
+
+            generation = self._item_generation(guid)
             response = self.table.get_item(Key={"guid": guid})
             item = response.get("Item")
+            if item:
+                self._cache_item(item, generation)
             return item
         except Exception as e:
             self.logger.error(f"Error retrieving metadata for item {guid}: {e}")
@@ -145,7 +686,11 @@ class DynamoDBState:
             True if item exists (and has specified status if provided), False otherwise
         """
         try:
-            response = self.table.get_item(Key={"guid": guid})
+            # Only the key and status are needed, not the whole item
+            response = self.table.get_item(
+                Key={"guid": guid},
+                ProjectionExpression="guid, processing_status",
+            )
             item = response.get("Item")
 
             # If item doesn't exist, return False
@@ -224,28 +769,30 @@ class DynamoDBState:
             self.logger.error(f"Error getting items needing processing: {e}")
             return []
 
-    def get_items_by_status_paths(
+    def iter_items_by_status_paths(
         self,
         html_path_exists: Optional[bool] = None,
         md_path_exists: Optional[bool] = None,
         summary_path_exists: Optional[bool] = None,
         has_newsletters: Optional[bool] = None,
-        limit: int = 100,
+        limit: Optional[int] = 100,
         as_content_items: bool = True,
-    ) -> Union[List[Dict[str, Any]], List[ContentItem]]:
+    ) -> Iterator[Union[Dict[str, Any], ContentItem]]:
         """
-        Get items based on their processing status paths.
+        Lazily get items based on their processing status paths, one scan page at a time,
+        so callers can start working on the first matches before the scan completes.
+        The next page is requested in the background while the current one is consumed.
 
         Args:
             html_path_exists: Filter for items with html_path
             md_path_exists: Filter for items with md_path
             summary_path_exists: Filter for items with summary_path
             has_newsletters: Filter for items with non-empty newsletters list
-            limit: Maximum number of items to return
-            as_content_items: If True, return as ContentItem objects instead of dictionaries
+            limit: Maximum number of items to yield (None for no limit)
+            as_content_items: If True, yield ContentItem objects instead of dictionaries
 
-        Returns:
-            List of matching items as ContentItem objects (or dictionaries if as_content_items=False)
+        Yields:
+            Matching items as ContentItem objects (or dictionaries if as_content_items=False)
         """
         try:
             # Build the filter expression based on provided flags
@@ -309,26 +856,50 @@ class DynamoDBState:
                     else filter_expression & new_condition
                 )
 
-            # Execute scan with the filter
+            scan_kwargs = {}
             if filter_expression:
-                response = self.table.scan(
-                    FilterExpression=filter_expression,
-                    Limit=limit,
-                )
-            else:
-                response = self.table.scan(Limit=limit)
+                scan_kwargs["FilterExpression"] = filter_expression
 
-            items = response.get("Items", [])
-
-            # Convert to ContentItem objects if requested
-            if as_content_items and items:
-                return [ContentItem.from_dict(item) for item in items]
-
-            return items
+            # Fetch the next page while this one is turned into ContentItems
+            for item in self._iter_scan(limit=limit, prefetch=True, **scan_kwargs):
+                yield ContentItem.from_dict(item) if as_content_items else item
 
         except Exception as e:
             self.logger.error(f"Error getting items by status paths: {e}")
-            return []
+
+    def get_items_by_status_paths(
+        self,
+        html_path_exists: Optional[bool] = None,
+        md_path_exists: Optional[bool] = None,
+        summary_path_exists: Optional[bool] = None,
+        has_newsletters: Optional[bool] = None,
+        limit: int = 100,
+        as_content_items: bool = True,
+    ) -> Union[List[Dict[str, Any]], List[ContentItem]]:
+        """
+        Get items based on their processing status paths.
+
+        Args:
+            html_path_exists: Filter for items with html_path
+            md_path_exists: Filter for items with md_path
+            summary_path_exists: Filter for items with summary_path
+            has_newsletters: Filter for items with non-empty newsletters list
+            limit: Maximum number of items to return
+            as_content_items: If True, return as ContentItem objects instead of dictionaries
+
+        Returns:
+            List of matching items as ContentItem objects (or dictionaries if as_content_items=False)
+        """
+        return list(
+            self.iter_items_by_status_paths(
+                html_path_exists=html_path_exists,
+                md_path_exists=md_path_exists,
+                summary_path_exists=summary_path_exists,
+                has_newsletters=has_newsletters,
+                limit=limit,
+                as_content_items=as_content_items,
+            )
+        )
 
     def get_items_for_stage(
         self,
@@ -363,7 +934,10 @@ class DynamoDBState:
             return []
 
         # Get items based on stage
-        if stage == "process":
+        if overwrite_flag and stage in STAGE_TARGET_PATHS:
+            # Items still needing the stage come first, then items to redo
+            items = self._get_items_to_overwrite(stage, limit)
+        elif stage == "process":
             # Get items that have HTML content but no markdown
             items = self.get_items_by_status_paths(
                 html_path_exists=True,
@@ -375,12 +949,11 @@ class DynamoDBState:
                 f"Found {len(items)} items needing initial processing (HTML exists but no markdown)"
             )
         elif stage == "summarize":
-            # Get items that have markdown but no summary
-            items = self.get_items_by_status_paths(
-                md_path_exists=True,
-                summary_path_exists=False,
-                limit=limit,
-                as_content_items=True,
+            # Get items that have markdown but no summary, leaving out items already
+            # judged not worth summarizing so their markdown isn't downloaded again
+            # every run (summarizing with overwrite re-evaluates them)
+            items = self.get_items_needing_summarization(
+                limit=limit, as_content_items=True
             )
             self.logger.debug(
                 f"Found {len(items)} items needing initial summarization (Markdown exists but no summary)"
@@ -397,39 +970,6 @@ class DynamoDBState:
                 f"Found {len(items)} items needing initial curation (Summary exists but no newsletters)"
             )
 
-        initial_count = len(items)
-        remaining_limit = limit - initial_count
-        self.logger.debug(
-            f"After initial query: {initial_count} items found, {remaining_limit} slots remaining in limit"
-        )
-
-        # If overwrite is enabled and we haven't hit the limit, also get items that already have the target content
-        if overwrite_flag and remaining_limit > 0:
-            if stage == "process":
-                # Get items that have both HTML and markdown
-                existing_items = self.get_items_by_status_paths(
-                    html_path_exists=True,
-                    md_path_exists=True,
-                    limit=remaining_limit,  # Only get up to remaining limit
-                    as_content_items=True,
-                )
-                self.logger.debug(
-                    f"Found {len(existing_items)} existing items to overwrite for processing (limited by remaining slots: {remaining_limit})"
-                )
-                items.extend(existing_items)
-            elif stage == "summarize":
-                # Get items that have both markdown and summary
-                existing_items = self.get_items_by_status_paths(
-                    md_path_exists=True,
-                    summary_path_exists=True,
-                    limit=remaining_limit,  # Only get up to remaining limit
-                    as_content_items=True,
-                )
-                self.logger.debug(
-                    f"Found {len(existing_items)} existing items to overwrite for summarization (limited by remaining slots: {remaining_limit})"
-                )
-                items.extend(existing_items)
-
         # Log details about each item being returned
         self.logger.debug(
             f"Total items being returned: {len(items)} (limit was {limit})"
@@ -441,6 +981,42 @@ class DynamoDBState:
 
         return items
 
+    def _get_items_to_overwrite(
+        self, stage: Literal["process", "summarize"], limit: int
+    ) -> List[ContentItem]:
+        """
+        Get up to limit items for a stage re-run with overwrite in a single scan: items
+        that still need the stage first, then items that already have its output.
+
+        The scan stops as soon as limit items needing the stage are found, so it never
+        reads more than a separate scan for each group would.
+
+        Args:
+            stage: The stage to get items for
+            limit: Maximum number of items to return
+
+        Returns:
+            List of ContentItem objects to (re)run the stage on
+        """
+        input_path, target_path = STAGE_TARGET_PATHS[stage]
+        pending: List[ContentItem] = []
+        existing: List[ContentItem] = []
+        for item in self.iter_items_by_status_paths(
+            **{f"{input_path}_exists": True}, limit=None, as_content_items=True
+        ):
+            if getattr(item, target_path) is None:
+                pending.append(item)
+                if len(pending) >= limit:
+                    break
+            elif len(existing) < limit:
+                existing.append(item)
+
+        self.logger.debug(
+            f"Found {len(pending)} items needing {stage} and {len(existing)} existing "
+            f"items to overwrite (limit {limit})"
+        )
+        return (pending + existing)[:limit]
+
     def get_items_needing_summarization(
         self, limit: int = 10, as_content_items: bool = True
     ) -> Union[List[Dict[str, Any]], List[ContentItem]]:
@@ -478,12 +1054,9 @@ class DynamoDBState:
             filter_expression = filter_expression & worth_condition
 
             # Execute scan with the filter
-            response = self.table.scan(
-                FilterExpression=filter_expression,
-                Limit=limit,
+            items = list(
+                self._iter_scan(limit=limit, FilterExpression=filter_expression)
             )
-
-            items = response.get("Items", [])
             self.logger.info(f"Found {len(items)} items that need summarization")
 
             # Convert to ContentItem objects if requested
@@ -499,60 +1072,159 @@ class DynamoDBState:
     def update_item(self, item: ContentItem, overwrite_flag: bool = False) -> bool:
         """
         Update an item in DynamoDB with the current state of a ContentItem.
-        Preserves existing fields by merging the new item with the existing one,
+        Preserves existing fields by only setting the fields present on the new item,
         unless overwrite_flag is True.
 
+        This is a single UpdateItem, which creates the item if it doesn't exist yet and
+        leaves any attributes it doesn't set untouched, so there is no need to read the
+        stored item first.
+
         Args:
             item: The ContentItem to update
-            overwrite_flag: If True, completely overwrite the item instead of merging
+            overwrite_flag: If True, write the item as is (including its own
+                last_updated) instead of refreshing last_updated
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            # First, get the existing item to ensure we preserve all fields
-            existing_item = self.get_item(item.guid)
-
-            if existing_item and not overwrite_flag:
-                # Create a merged item by starting with existing data
-                # and then updating with the new data (only non-None fields)
-                merged_dict = existing_item.to_dict()
-
-                # Convert new item to dictionary
-                new_dict = item.to_dict()
-
-                # Merge fields, only updating those present in the new item
-                # and skipping 'guid' which is the primary key
-                for key, value in new_dict.items():
-                    if key != "guid" and value is not None:
-                        merged_dict[key] = value
+            # to_dict drops None fields, so only the fields present in the new item are
+            # set; guid is the primary key and is passed separately
+            updates = item.to_dict()
+            guid = updates.pop("guid")
 
+            if not overwrite_flag:
                 # Always update the last_updated timestamp
-                merged_dict["last_updated"] = datetime.now().isoformat()
-
-                # Log what we're merging for debugging
+                updates["last_updated"] = datetime.now().isoformat()
                 self.logger.debug(
-                    f"Merging item {item.guid} - preserving existing paths: "
-                    f"md_path={merged_dict.get('md_path')}, "
-                    f"summary_path={merged_dict.get('summary_path')}, "
-                    f"short_summary_path={merged_dict.get('short_summary_path')}"
+                    f"Merging item {guid} - setting paths: "
+                    f"md_path={updates.get('md_path')}, "
+                    f"summary_path={updates.get('summary_path')}, "
+                    f"short_summary_path={updates.get('short_summary_path')}"
                 )
 
-                # Remove guid which is the primary key - we'll use it separately
-                guid = merged_dict.pop("guid")
-
-                # Update the item using the existing update_metadata method
-                return self.update_metadata(guid, merged_dict)
-            else:
-                # If no existing item or overwrite is enabled, just update with the new item
-                item_dict = item.to_dict()
-                guid = item_dict.pop("guid")
-                return self.update_metadata(guid, item_dict)
+            return self.update_metadata(guid, updates)
 
         except Exception as e:
             self.logger.error(f"Error updating item {item.guid}: {e}")
             return False
 
+    def batch_update_items(
+        self,
+        items: List[ContentItem],
+        overwrite_flag: bool = False,
+        max_workers: int = 8,
+    ) -> bool:
+        """
+        Batch equivalent of update_item: one UpdateItem per item, sent concurrently.
+
+        Like update_item, each request only sets the item's non-None fields, so it
+        needs no read of the stored items first and can't overwrite changes made to
+        other fields in the meantime (e.g. by another stage). The newsletters list is
+        left to add_to_newsletter, so a stale copy can't replace a concurrent append.
+        Several ContentItems with the same GUID are merged, in order, into one request.
+
+        Args:
+            items: The ContentItems to update
+            overwrite_flag: If True, don't refresh last_updated (matches update_item,
+                            which writes the item's own fields as given)
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            True if all items were written, False otherwise
+        """
+        if not items:
+            return True
+
+        now = datetime.now().isoformat()
+        updates_by_guid: Dict[str, Dict[str, Any]] = {}
+        for item in items:
+            updates = updates_by_guid.setdefault(item.guid, {})
+            updates.update(item.to_dict())
+        for updates in updates_by_guid.values():
+            updates.pop("guid")
+            updates.pop("newsletters", None)
+            if not overwrite_flag:
+                updates["last_updated"] = now
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers, len(updates_by_guid))
+        ) as executor:
+            results = list(
+                executor.map(
+                    lambda guid: self.update_metadata(guid, updates_by_guid[guid]),
+                    updates_by_guid,
+                )
+            )
+
+        self.logger.info(f"Batch-updated {sum(results)} of {len(results)} items")
+        return all(results)
+
+    def add_to_newsletter(
+        self, guids: List[str], newsletter_id: str, max_workers: int = 8
+    ) -> bool:
+        """
+        Record that several items were included in a newsletter, appending the
+        newsletter ID to each item's newsletters list.
+
+        Each item gets its own UpdateItem (list_append), sent concurrently, so it
+        needs no read of the stored items first and can't overwrite changes made to
+        other fields in the meantime. The append is
+        conditional on the ID not being in the list yet, so a retried request can't
+        record it twice.
+
+        Args:
+            guids: The unique identifiers of the items
+            newsletter_id: The ID of the newsletter they were included in
+            max_workers: Maximum number of concurrent requests
+
+        Returns:
+            True if every item was updated, False otherwise
+        """
+        if not guids:
+            return True
+        now = datetime.now().isoformat()
+
+        def append(guid: str) -> bool:
+            try:
+                try:
+                    self.table.update_item(
+                        Key={"guid": guid},
+                        UpdateExpression=(
+                            "SET newsletters = list_append("
+                            "if_not_exists(newsletters, :empty), :newsletter), "
+                            f"last_updated = :now, {self.ADMIN_INDEX_KEY} = :admin_key"
+                        ),
+                        ConditionExpression="NOT contains(newsletters, :newsletter_id)",
+                        ExpressionAttributeValues={
+                            ":empty": [],
+                            ":newsletter": [newsletter_id],
+                            ":newsletter_id": newsletter_id,
+                            ":now": now,
+                            ":admin_key": self.ADMIN_INDEX_KEY_VALUE,
+                        },
+                    )
+                finally:
+                    self._uncache_item(guid)
+                return True
+            except ClientError as e:
+                if e.response["Error"]["Code"] == "ConditionalCheckFailedException":
+                    # Already recorded
+                    return True
+                self.logger.error(f"Error adding item {guid} to {newsletter_id}: {e}")
+                return False
+            except Exception as e:
+                self.logger.error(f"Error adding item {guid} to {newsletter_id}: {e}")
+                return False
+
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(guids))) as executor:
+            results = list(executor.map(append, guids))
+
+        self.logger.info(
+            f"Added {sum(results)} of {len(guids)} items to newsletter {newsletter_id}"
+        )
+        return all(results)
+
     def update_metadata(self, guid: str, updates: Dict[str, Any]) -> bool:
         """
         Update metadata fields for an item.
@@ -572,6 +1244,9 @@ class DynamoDBState:
             update_expression = "SET "
             expression_attribute_values = {}
 
+            # Keep every updated item listable through the admin index
+            updates = {**updates, self.ADMIN_INDEX_KEY: self.ADMIN_INDEX_KEY_VALUE}
+
             for key, value in updates.items():
                 update_expression += f"{key} = :{key.replace('-', '_')}, "
                 expression_attribute_values[f":{key.replace('-', '_')}"] = value
@@ -580,15 +1255,21 @@ class DynamoDBState:
             update_expression = update_expression[:-2]
 
             # Perform the update
-            self.table.update_item(
-                Key={"guid": guid},
-                UpdateExpression=update_expression,
-                ExpressionAttributeValues=expression_attribute_values,
-            )
+            try:
+                self.table.update_item(
+                    Key={"guid": guid},
+                    UpdateExpression=update_expression,
+                    ExpressionAttributeValues=expression_attribute_values,
+                )
+            finally:
+                # Also drops a pre-write copy cached by a read that raced the update
+                self._uncache_item(guid)
 
             # Format a readable update summary, excluding last_updated which changes every time
             update_fields = [
-                f"{k}={v}" for k, v in updates.items() if k != "last_updated"
+                f"{k}={v}"
+                for k, v in updates.items()
+                if k not in ("last_updated", self.ADMIN_INDEX_KEY)
             ]
             if update_fields:
                 update_summary = ", ".join(update_fields)
@@ -613,7 +1294,10 @@ class DynamoDBState:
             True if successful, False otherwise
         """
         try:
-            self.table.delete_item(Key={"guid": guid})
+            try:
+                self.table.delete_item(Key={"guid": guid})
+            finally:
+                self._uncache_item(guid)
             self.logger.info(f"Deleted item with GUID: {guid}")
             return True
         except Exception as e:
@@ -634,19 +1318,7 @@ class DynamoDBState:
             List of all items in the table as ContentItem objects (or dictionaries if as_content_items=False)
         """
         try:
-            items = []
-            scan_kwargs = {}
-            done = False
-            start_key = None
-
-            while not done:
-                if start_key:
-                    scan_kwargs["ExclusiveStartKey"] = start_key
-                response = self.table.scan(**scan_kwargs)
-                items.extend(response.get("Items", []))
-                start_key = response.get("LastEvaluatedKey", None)
-                done = start_key is None
-
+            items = list(self._iter_scan())
             self.logger.info(f"Retrieved {len(items)} items from DynamoDB")
 
             # Convert to ContentItem objects if requested
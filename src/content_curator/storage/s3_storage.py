@@ -1,9 +1,33 @@
-from typing import List, Optional
+import gzip
+import io
+import zlib
+from concurrent.futures import ThreadPoolExecutor
+from typing import Dict, List, Optional, Tuple
 
 import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.client import BaseClient
+from botocore.config import Config
+from botocore.exceptions import ClientError
 from loguru import logger
 
+# gzip level for compressed objects: close to the best ratio for text at a fraction of
+# the CPU cost of level 9
+GZIP_COMPRESS_LEVEL = 6
+
+# User metadata key recording the uncompressed size of gzip-compressed objects, so
+# get_content_range can report it without downloading the whole object
+UNCOMPRESSED_SIZE_METADATA = "uncompressed-size"
+
+# Objects at least this large are uploaded in parts, several at a time (and a failed
+# part is retried on its own); smaller ones go up in a single PUT
+MULTIPART_THRESHOLD = 8 * 1024 * 1024
+MULTIPART_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=MULTIPART_THRESHOLD,
+    multipart_chunksize=MULTIPART_THRESHOLD,
+    max_concurrency=8,
+)
+
 
 class S3Storage:
     """
@@ -15,6 +39,8 @@ class S3Storage:
         self,
         s3_bucket_name: str,
         aws_region: str = "us-east-1",
+        botocore_config: Optional[Config] = None,
+        session: Optional[boto3.Session] = None,
     ) -> None:
         """
         Initialize S3 storage with bucket name.
@@ -22,14 +48,25 @@ class S3Storage:
         Args:
             s3_bucket_name: Name of the S3 bucket
             aws_region: AWS region to use
+            botocore_config: Optional botocore Config (e.g. a larger connection pool
+                for concurrent callers)
+            session: Optional boto3 Session to create the client from, so several
+                clients share one credential lookup (defaults to the global session)
         """
         self.s3_bucket_name: str = s3_bucket_name
         self.aws_region: str = aws_region
 
         # Initialize S3 client
-        self.s3: BaseClient = boto3.client("s3", region_name=aws_region)
+        self.s3: BaseClient = (session or boto3).client(
+            "s3", region_name=aws_region, config=botocore_config
+        )
         self.logger = logger
 
+    @property
+    def max_pool_connections(self) -> int:
+        """The number of connections the client keeps open for concurrent requests."""
+        return self.s3.meta.config.max_pool_connections
+
     def check_resources_exist(self) -> bool:
         """
         Check if necessary S3 bucket exists.
@@ -46,7 +83,11 @@ class S3Storage:
             return False
 
     def store_content(
-        self, key: str, content: str, content_type: str = "text/markdown"
+        self,
+        key: str,
+        content: str,
+        content_type: str = "text/markdown",
+        compress: bool = False,
     ) -> bool:
         """
         Store content in S3.
@@ -55,17 +96,33 @@ class S3Storage:
             key: S3 key (path) to store the content at
             content: The content to store
             content_type: The content type (MIME type)
+            compress: If True, store the content gzip-compressed (with Content-Encoding
+                set, so get_content and HTTP clients decompress it transparently).
+                Ranged reads of compressed objects have to download the whole object
 
         Returns:
             True if successful, False otherwise
         """
         try:
-            self.s3.put_object(
-                Bucket=self.s3_bucket_name,
-                Key=key,
-                Body=content,
-                ContentType=content_type,
-            )
+            put_kwargs = {"ContentType": content_type}
+            body = content.encode("utf-8")
+            if compress:
+                put_kwargs["ContentEncoding"] = "gzip"
+                put_kwargs["Metadata"] = {UNCOMPRESSED_SIZE_METADATA: str(len(body))}
+                body = gzip.compress(body, compresslevel=GZIP_COMPRESS_LEVEL)
+
+            if len(body) < MULTIPART_THRESHOLD:
+                self.s3.put_object(
+                    Bucket=self.s3_bucket_name, Key=key, Body=body, **put_kwargs
+                )
+            else:
+                self.s3.upload_fileobj(
+                    io.BytesIO(body),
+                    self.s3_bucket_name,
+                    key,
+                    ExtraArgs=put_kwargs,
+                    Config=MULTIPART_TRANSFER_CONFIG,
+                )
             self.logger.info(f"Stored content at S3 path: {key}")
             return True
         except Exception as e:
@@ -84,12 +141,187 @@ class S3Storage:
         """
         try:
             response = self.s3.get_object(Bucket=self.s3_bucket_name, Key=key)
-            content: str = response["Body"].read().decode("utf-8")
-            return content
+            body: bytes = response["Body"].read()
+            if response.get("ContentEncoding") == "gzip":
+                body = gzip.decompress(body)
+            return body.decode("utf-8")
         except Exception as e:
             self.logger.error(f"Error retrieving content from S3 path {key}: {e}")
             return None
 
+    def get_content_range(
+        self, key: str, start: int = 0, end: Optional[int] = None
+    ) -> Tuple[Optional[str], Optional[int]]:
+        """
+        Retrieve a byte range of content from S3 with a ranged GET.
+
+        For gzip-compressed objects the range is of the decompressed content. It is
+        taken from the decompressed start of the compressed bytes the same ranged GET
+        returns, which (text compressing several times over) cover it, so only the
+        range's worth of the object is downloaded.
+
+        Args:
+            key: The S3 key (path) of the content
+            start: First byte to retrieve
+            end: Last byte to retrieve (inclusive), or None for the rest of the object
+
+        Returns:
+            Tuple of the content in the range (a multi-byte character split at the end
+            of the range is dropped) and the total object size, or (None, None) if not found
+        """
+        byte_range = f"bytes={start}-{'' if end is None else end}"
+        try:
+            response = self.s3.get_object(
+                Bucket=self.s3_bucket_name, Key=key, Range=byte_range
+            )
+            if response.get("ContentEncoding") == "gzip":
+                return self._get_gzip_content_range(key, response, start, end)
+            content: str = response["Body"].read().decode("utf-8", errors="ignore")
+            # ContentRange looks like "bytes 0-262143/1048576"
+            content_range = response.get("ContentRange")
+            total_size = (
+                int(content_range.rsplit("/", 1)[1])
+                if content_range
+                else response["ContentLength"]
+            )
+            return content, total_size
+        except ClientError as e:
+            if e.response["Error"]["Code"] == "InvalidRange":
+                # The range starts past the end of the object (e.g. an empty file)
+                return "", 0
+            self.logger.error(f"Error retrieving content from S3 path {key}: {e}")
+            return None, None
+        except Exception as e:
+            self.logger.error(f"Error retrieving content from S3 path {key}: {e}")
+            return None, None
+
+    def _get_gzip_content_range(
+        self, key: str, response: Dict, start: int, end: Optional[int]
+    ) -> Tuple[str, int]:
+        """
+        Take a byte range of decompressed content from a ranged GET of a
+        gzip-compressed object (see get_content_range).
+
+        Args:
+            key: The S3 key (path) of the content
+            response: The get_object response for the range start-end of the object
+            start: First byte to retrieve
+            end: Last byte to retrieve (inclusive), or None for the rest of the object
+
+        Returns:
+            Tuple of the content in the range and the total decompressed size
+        """
+        range_end = None if end is None else end + 1
+        if start:
+            # Decompression has to begin at the start of the object
+            response["Body"].close()
+            response = self.s3.get_object(
+                Bucket=self.s3_bucket_name,
+                Key=key,
+                Range=f"bytes=0-{'' if end is None else end}",
+            )
+
+        decompressor = zlib.decompressobj(wbits=zlib.MAX_WBITS | 16)
+        # A range of the compressed stream decompresses to a prefix of the content
+        body = decompressor.decompress(response["Body"].read(), range_end or 0)
+
+        if decompressor.eof:
+            total_size = len(body)
+        elif UNCOMPRESSED_SIZE_METADATA in response.get("Metadata", {}):
+            total_size = int(response["Metadata"][UNCOMPRESSED_SIZE_METADATA])
+        else:
+            # Compressed before the size was recorded: the gzip trailer ends with the
+            # uncompressed size (modulo 2**32)
+            trailer = self.s3.get_object(
+                Bucket=self.s3_bucket_name, Key=key, Range="bytes=-4"
+            )
+            total_size = int.from_bytes(trailer["Body"].read(), "little")
+
+        return body[start:range_end].decode("utf-8", errors="ignore"), total_size
+
+    def get_contents(
+        self, keys: List[str], max_workers: Optional[int] = None
+    ) -> Dict[str, Optional[str]]:
+        """
+        Retrieve several objects from S3 concurrently.
+
+        Args:
+            keys: The S3 keys (paths) of the content
+            max_workers: Maximum number of concurrent requests. Defaults to the
+                client's max_pool_connections, so every worker gets a connection
+
+        Returns:
+            Dictionary mapping each key to its content, or None if it could not be read
+        """
+        unique_keys = list(dict.fromkeys(keys))
+        if not unique_keys:
+            return {}
+
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers or self.max_pool_connections, len(unique_keys))
+        ) as executor:
+            return dict(zip(unique_keys, executor.map(self.get_content, unique_keys)))
+
+    def store_contents(
+        self,
+        contents: Dict[str, str],
+        content_type: str = "text/markdown",
+        max_workers: Optional[int] = None,
+        compress: bool = False,
+    ) -> Dict[str, bool]:
+        """
+        Store several objects in S3 concurrently.
+
+        Args:
+            contents: Dictionary mapping S3 keys (paths) to the content to store
+            content_type: The content type (MIME type) for all objects
+            max_workers: Maximum number of concurrent requests. Defaults to the
+                client's max_pool_connections, so every worker gets a connection
+            compress: If True, store the objects gzip-compressed (see store_content)
+
+        Returns:
+            Dictionary mapping each key to True if it was stored, False otherwise
+        """
+        if not contents:
+            return {}
+
+        keys = list(contents)
+        with ThreadPoolExecutor(
+            max_workers=min(max_workers or self.max_pool_connections, len(keys))
+        ) as executor:
+            results = executor.map(
+                lambda key: self.store_content(
+                    key, contents[key], content_type, compress
+                ),
+                keys,
+            )
+            return dict(zip(keys, results))
+
+    def copy_object(self, source_key: str, dest_key: str) -> bool:
+        """
+        Copy an object within the bucket (server-side, without downloading it).
+
+        Args:
+            source_key: S3 key (path) of the object to copy
+            dest_key: S3 key (path) to copy the object to
+
+        Returns:
+            True if successful, False otherwise
+        """
+        try:
+            self.s3.copy_object(
+                Bucket=self.s3_bucket_name,
+                Key=dest_key,
+                CopySource={"Bucket": self.s3_bucket_name, "Key": source_key},
+            )
+            self.logger.debug(f"Copied S3 object {source_key} to {dest_key}")
+            return True
+        except Exception as e:
+            self.logger.error(
+                f"Error copying S3 object {source_key} to {dest_key}: {e}"
+            )
+            return False
+
     def object_exists(self, key: str) -> bool:
         """
         Check if an object exists in S3 without retrieving its content.
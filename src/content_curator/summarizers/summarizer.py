@@ -1,10 +1,14 @@
+import asyncio
 import os
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, List, Literal, Optional
+from typing import Dict, List, Literal, Optional, Tuple
 
 from dotenv import load_dotenv
 from langchain_core.language_models.chat_models import BaseChatModel
-from langchain_core.messages import HumanMessage, SystemMessage
+from langchain_core.messages import BaseMessage, HumanMessage, SystemMessage
+from langchain_core.rate_limiters import InMemoryRateLimiter
 from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_openai import ChatOpenAI
 from loguru import logger
@@ -12,13 +16,21 @@ from loguru import logger
 from src.content_curator.models import ContentItem, SummaryType
 from src.content_curator.storage.dynamodb_state import DynamoDBState
 from src.content_curator.storage.s3_storage import S3Storage
-from src.content_curator.utils import is_worth_summarizing
+from src.content_curator.utils import (
+    content_hash,
+    is_worth_summarizing,
+    markdown_body,
+)
 
 # Define prompt types
 ModelName = Literal[
     "gemini-1.5-flash", "gemini-2.0-flash", "gpt-3.5-turbo", "gpt-4-turbo", "gpt-4o"
 ]
 
+# Generated summaries are cached in S3 under this prefix, keyed on a hash of the model,
+# prompt and article body, so a re-summarized article doesn't cost another LLM call
+SUMMARY_CACHE_PREFIX = "cache/summaries"
+
 load_dotenv()
 
 
@@ -32,6 +44,8 @@ class Summarizer:
         max_output_tokens: Optional[int] = None,
         s3_storage: Optional[S3Storage] = None,
         state_manager: Optional[DynamoDBState] = None,
+        max_concurrency: int = 4,
+        requests_per_minute: Optional[int] = None,
     ):
         """
         Initialize the summarizer with a language model and load prompts from files.
@@ -42,12 +56,20 @@ class Summarizer:
             max_output_tokens: Maximum number of tokens to allow for the model's output
             s3_storage: Optional S3Storage instance for retrieving and storing content
             state_manager: Optional DynamoDBState instance for updating item state
+            max_concurrency: Maximum number of summaries to request from the LLM at once
+            requests_per_minute: If given, space LLM requests to stay under this rate
+                (the provider's rate limit); None for no limit
         """
         self.logger = logger
         self.model_name = model_name
         self.s3_storage = s3_storage
         self.state_manager = state_manager
+        self.max_concurrency = max_concurrency
         self.prompt_templates: Dict[str, str] = {}
+        # Event loop (run on a background thread) every batch's async requests are
+        # sent on; started on first use
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._loop_lock = threading.Lock()
 
         # Load prompts from files
         summarizer_dir = Path(__file__).parent
@@ -75,6 +97,17 @@ class Summarizer:
                 "No prompt templates could be loaded. Please ensure prompt files exist."
             )
 
+        # Shared by every request the model makes, so concurrent batch requests are
+        # spaced out together rather than each retrying after hitting the limit
+        rate_limiter = (
+            InMemoryRateLimiter(
+                requests_per_second=requests_per_minute / 60,
+                max_bucket_size=max_concurrency,
+            )
+            if requests_per_minute
+            else None
+        )
+
         # Initialize the language model
         try:
             self.llm: BaseChatModel
@@ -99,6 +132,7 @@ class Summarizer:
                         model="gemini-1.5-flash",
                         temperature=temperature,
                         google_api_key=google_api_key,
+                        rate_limiter=rate_limiter,
                         **model_kwargs,
                     )
                     self.logger.info("Successfully initialized Gemini 1.5 Flash model")
@@ -110,10 +144,17 @@ class Summarizer:
                     model_kwargs["max_tokens"] = max_output_tokens
 
                 self.llm = ChatOpenAI(
-                    model_name=model_name, temperature=temperature, **model_kwargs
+                    model_name=model_name,
+                    temperature=temperature,
+                    rate_limiter=rate_limiter,
+                    **model_kwargs,
                 )
                 self.logger.info(f"Using OpenAI model: {model_name}")
 
+            # Record the model actually used (after any fallback): it is part of the
+            # summary cache key, so summaries are never served as another model's
+            self.model_name = model_name
+
             self.logger.info(
                 f"Initialized summarizer with model: {model_name}, "
                 f"Max Output Tokens: {max_output_tokens or 'Default'}"
@@ -125,18 +166,18 @@ class Summarizer:
             )
             raise
 
-    def summarize_text(
-        self, content: str, summary_type: SummaryType = "standard"
-    ) -> Optional[str]:
+    def _build_messages(
+        self, content: str, summary_type: SummaryType
+    ) -> Optional[List[BaseMessage]]:
         """
-        Generate a summary of the provided content.
+        Build the LLM messages for summarizing some content.
 
         Args:
             content: The text content to summarize
             summary_type: The type of summary to generate ("standard" or "brief")
 
         Returns:
-            A summary of the content or None if summarization fails
+            The system and human messages, or None if the content or summary type is invalid
         """
         if not content or not isinstance(content, str) or not content.strip():
             self.logger.warning(
@@ -152,29 +193,198 @@ class Summarizer:
             )
             return None
 
-        try:
-            # Create messages with system prompt and content
-            messages = [SystemMessage(content=prompt), HumanMessage(content=content)]
+        # Create messages with system prompt and content
+        return [SystemMessage(content=prompt), HumanMessage(content=content)]
 
-            # Get response from the LLM
-            response = self.llm.invoke(messages)
+    def _extract_summary(
+        self, response: BaseMessage, summary_type: SummaryType
+    ) -> Optional[str]:
+        """
+        Extract the summary text from an LLM response.
 
-            # Extract the summary text
-            summary = response.content.strip()
+        Args:
+            response: The LLM response message
+            summary_type: The type of summary that was requested
 
-            if summary:
-                self.logger.info(f"Successfully generated '{summary_type}' summary")
-                return summary
-            else:
-                self.logger.warning(
-                    f"'{summary_type}' summarization did not produce expected output"
-                )
-                return None
+        Returns:
+            The summary, or None if the response was empty
+        """
+        summary = response.content.strip()
+
+        if summary:
+            self.logger.info(f"Successfully generated '{summary_type}' summary")
+            return summary
+
+        self.logger.warning(
+            f"'{summary_type}' summarization did not produce expected output"
+        )
+        return None
+
+    def summarize_text(
+        self, content: str, summary_type: SummaryType = "standard"
+    ) -> Optional[str]:
+        """
+        Generate a summary of the provided content.
+
+        Args:
+            content: The text content to summarize
+            summary_type: The type of summary to generate ("standard" or "brief")
+
+        Returns:
+            A summary of the content or None if summarization fails
+        """
+        messages = self._build_messages(content, summary_type)
+        if not messages:
+            return None
+
+        try:
+            # Get response from the LLM
+            return self._extract_summary(self.llm.invoke(messages), summary_type)
 
         except Exception as e:
             self.logger.exception(f"Failed to generate '{summary_type}' summary: {e}")
             return None
 
+    def _summary_cache_key(self, content: str, summary_type: SummaryType) -> str:
+        """
+        Build the content-addressed cache key for a summary of some processed markdown.
+
+        The key covers the model and prompt as well as the article body (with the
+        metadata header dropped and whitespace normalized), so changing either
+        invalidates the cached summaries.
+
+        Args:
+            content: The processed markdown content
+            summary_type: The type of summary
+
+        Returns:
+            The S3 key under which the summary is cached
+        """
+        normalized_body = " ".join(markdown_body(content).split())
+        key_hash = content_hash(
+            "\n".join(
+                [
+                    self.model_name,
+                    self.prompt_templates.get(summary_type, ""),
+                    normalized_body,
+                ]
+            )
+        )
+        return f"{SUMMARY_CACHE_PREFIX}/{summary_type}/{key_hash}.md"
+
+    def _get_loop(self) -> asyncio.AbstractEventLoop:
+        """
+        Return the event loop batches are run on, starting it on first use.
+
+        The model's async HTTP client stays bound to the loop it was first used on, so
+        every batch has to run on the same long-lived loop: a fresh loop per batch
+        (asyncio.run) leaves later batches failing with "Event loop is closed".
+        """
+        with self._loop_lock:
+            if self._loop is None:
+                self._loop = asyncio.new_event_loop()
+                threading.Thread(
+                    target=self._loop.run_forever,
+                    name="summarizer-event-loop",
+                    daemon=True,
+                ).start()
+            return self._loop
+
+    def close(self) -> None:
+        """
+        Stop the event loop batches are run on, if it was started. Call once the
+        summarizer is no longer needed: the model's async client stays bound to that
+        loop, so batches can't be summarized afterwards.
+        """
+        with self._loop_lock:
+            if self._loop is not None:
+                self._loop.call_soon_threadsafe(self._loop.stop)
+                self._loop = None
+
+    def _summarize_batch(
+        self, requests: List[Tuple[str, SummaryType]]
+    ) -> List[Optional[str]]:
+        """
+        Generate summaries for several (content, summary type) pairs, submitting the LLM
+        requests as one batch with up to max_concurrency requests in flight.
+
+        The batch goes through the model's async client on the summarizer's event
+        loop (one loop waiting on every request) rather than a thread per request.
+
+        Args:
+            requests: The text content to summarize and the type of summary to generate
+
+        Returns:
+            A summary (or None if summarization failed) for each request, in order
+        """
+        summaries: List[Optional[str]] = [None] * len(requests)
+        valid_requests = [
+            (i, summary_type, messages)
+            for i, (content, summary_type) in enumerate(requests)
+            if (messages := self._build_messages(content, summary_type))
+        ]
+        if not valid_requests:
+            return summaries
+
+        # Submit requests sharing a system prompt back to back, so the provider's
+        # prompt-prefix cache can reuse the prompt across the whole group
+        valid_requests.sort(key=lambda request: request[1])
+        inputs = [messages for _, _, messages in valid_requests]
+        batch_config = {"max_concurrency": self.max_concurrency}
+        try:
+            responses = asyncio.run_coroutine_threadsafe(
+                self.llm.abatch(inputs, config=batch_config, return_exceptions=True),
+                self._get_loop(),
+            ).result()
+        except Exception as e:
+            self.logger.exception(f"Failed to generate summaries in batch: {e}")
+            return summaries
+
+        for (i, summary_type, _), response in zip(valid_requests, responses):
+            if isinstance(response, Exception):
+                self.logger.error(
+                    f"Failed to generate '{summary_type}' summary: {response}"
+                )
+                continue
+            summaries[i] = self._extract_summary(response, summary_type)
+
+        return summaries
+
+    def summarize_texts(
+        self, contents: List[str], summary_type: SummaryType = "standard"
+    ) -> List[Optional[str]]:
+        """
+        Generate summaries of several texts with one batch of LLM requests.
+
+        Args:
+            contents: The text contents to summarize
+            summary_type: The type of summary to generate ("standard" or "brief")
+
+        Returns:
+            A summary (or None if summarization failed) for each content, in order
+        """
+        return self._summarize_batch([(content, summary_type) for content in contents])
+
+    def summarize_text_multi(
+        self,
+        content: str,
+        summary_types: Tuple[SummaryType, ...] = ("standard", "brief"),
+    ) -> Dict[SummaryType, Optional[str]]:
+        """
+        Generate several types of summary of the same content, requesting them all at once.
+
+        Args:
+            content: The text content to summarize
+            summary_types: The types of summary to generate
+
+        Returns:
+            Dictionary mapping each summary type to its summary (or None if it failed)
+        """
+        summaries = self._summarize_batch(
+            [(content, summary_type) for summary_type in summary_types]
+        )
+        return dict(zip(summary_types, summaries))
+
     def summarize_item(
         self, item: ContentItem, summary_type: SummaryType = "standard"
     ) -> ContentItem:
@@ -196,7 +406,22 @@ class Summarizer:
 
         # Generate the summary
         summary = self.summarize_text(item.markdown_content, summary_type=summary_type)
+        return self._apply_summary(item, summary, summary_type)
+
+    def _apply_summary(
+        self, item: ContentItem, summary: Optional[str], summary_type: SummaryType
+    ) -> ContentItem:
+        """
+        Add a generated summary, and the S3 path it will be stored at, to an item.
 
+        Args:
+            item: The ContentItem that was summarized
+            summary: The generated summary (None if summarization failed)
+            summary_type: The type of summary ("standard" or "brief")
+
+        Returns:
+            The ContentItem with the summary added
+        """
         # Add summary to the item based on type
         if summary:
             if summary_type == "standard":
@@ -231,8 +456,21 @@ class Summarizer:
             f"Batch summarizing {len(items)} items with '{summary_type}' summary type"
         )
 
+        # Items without markdown are left unchanged
+        to_summarize = []
         for item in items:
-            self.summarize_item(item, summary_type=summary_type)
+            if item.markdown_content:
+                to_summarize.append(item)
+            else:
+                self.logger.warning(
+                    f"No markdown content to summarize for item '{item.guid}'"
+                )
+
+        summaries = self.summarize_texts(
+            [item.markdown_content for item in to_summarize], summary_type=summary_type
+        )
+        for item, summary in zip(to_summarize, summaries):
+            self._apply_summary(item, summary, summary_type)
 
         self.logger.info(f"Generated {summary_type} summaries for {len(items)} items")
         return items
@@ -247,11 +485,18 @@ class Summarizer:
         Returns:
             The same list of ContentItems with both summaries added
         """
-        # Generate standard summaries
-        self.batch_summarize(items, summary_type="standard")
-
-        # Generate brief summaries
-        self.batch_summarize(items, summary_type="brief")
+        # Request both types for every item in one batch, rather than a batch per type
+        to_summarize = [item for item in items if item.markdown_content]
+        jobs = [
+            (item, summary_type)
+            for item in to_summarize
+            for summary_type in ("standard", "brief")
+        ]
+        summaries = self._summarize_batch(
+            [(item.markdown_content, summary_type) for item, summary_type in jobs]
+        )
+        for (item, summary_type), summary in zip(jobs, summaries):
+            self._apply_summary(item, summary, summary_type)
 
         self.logger.info(f"Generated both summary types for {len(items)} items")
         return items
@@ -293,6 +538,36 @@ class Summarizer:
             guid=item.guid, path_formats=path_formats, configured_path=configured_path
         )
 
+    def _check_summaries_at_paths(
+        self, items: List[ContentItem], summary_types: List[SummaryType]
+    ) -> List[Tuple[bool, bool]]:
+        """
+        Check which of the requested summaries exist for several items, with the S3
+        lookups for all items made concurrently.
+
+        Args:
+            items: The ContentItems to check
+            summary_types: The summary types to check for (others are reported missing)
+
+        Returns:
+            (has standard summary, has brief summary) for each item, in order
+        """
+
+        def check(item: ContentItem) -> Tuple[bool, bool]:
+            return (
+                "standard" in summary_types
+                and self._check_summary_at_paths(item, "standard"),
+                "brief" in summary_types
+                and self._check_summary_at_paths(item, "brief"),
+            )
+
+        if not items or not self.s3_storage:
+            return [(False, False) for _ in items]
+        with ThreadPoolExecutor(
+            max_workers=min(self.s3_storage.max_pool_connections, len(items))
+        ) as executor:
+            return list(executor.map(check, items))
+
     def summarize_and_update_state(
         self,
         items_to_summarize: List[ContentItem],
@@ -318,21 +593,19 @@ class Summarizer:
             return []
 
         summarized_items = []
+        items_to_update: Dict[str, ContentItem] = {}
         items_successfully_summarized = 0
         skipped_already_summarized = 0
         skipped_not_worth_summarizing = 0
         skipped_no_markdown = 0
 
-        for item in items_to_summarize:
-            # Check if summaries exist at any possible path
-            has_standard_summary = (
-                "standard" in summary_types
-                and self._check_summary_at_paths(item, "standard")
-            )
-            has_brief_summary = (
-                "brief" in summary_types and self._check_summary_at_paths(item, "brief")
-            )
-
+        items_needing_summaries = []
+        items_to_generate: List[ContentItem] = []
+        summary_jobs: List[Tuple[ContentItem, SummaryType]] = []
+        for item, (has_standard_summary, has_brief_summary) in zip(
+            items_to_summarize,
+            self._check_summaries_at_paths(items_to_summarize, summary_types),
+        ):
             self.logger.info(
                 f"Item {item.guid} has standard summary: {has_standard_summary}, brief summary: {has_brief_summary}"
             )
@@ -356,9 +629,22 @@ class Summarizer:
                 skipped_already_summarized += 1
                 continue
 
-            # Fetch markdown content from S3 if not already loaded
+            items_needing_summaries.append(
+                (item, has_standard_summary, has_brief_summary)
+            )
+
+        # Fetch markdown content from S3 concurrently for items that don't have it loaded
+        markdown_contents = self.s3_storage.get_contents(
+            [
+                item.md_path
+                for item, _, _ in items_needing_summaries
+                if not item.markdown_content and item.md_path
+            ]
+        )
+
+        for item, has_standard_summary, has_brief_summary in items_needing_summaries:
             if not item.markdown_content and item.md_path:
-                markdown_content = self.s3_storage.get_content(item.md_path)
+                markdown_content = markdown_contents.get(item.md_path)
                 if markdown_content:
                     item.markdown_content = markdown_content
                 else:
@@ -371,11 +657,22 @@ class Summarizer:
             # ALWAYS evaluate if content is worth summarizing
             # This is now the ONLY place where to_be_summarized gets set
             # If item is already marked as a paywall, we don't need to check if it's worth summarizing
+            markdown_hash = content_hash(item.markdown_content)
+            reuse_determination = (
+                not overwrite_flag
+                and item.to_be_summarized is not None
+                and item.to_be_summarized_hash == markdown_hash
+            )
             if item.is_paywall:
                 item.to_be_summarized = False
                 self.logger.info(
                     f"Item {item.guid} is a paywall, not worth summarizing"
                 )
+            elif reuse_determination:
+                # The markdown hasn't changed since it was last evaluated
+                self.logger.info(
+                    f"Item {item.guid} unchanged since last evaluation, to_be_summarized={item.to_be_summarized}"
+                )
             else:
                 # Determine if content is worth summarizing using the utility function
                 item.to_be_summarized = is_worth_summarizing(
@@ -383,13 +680,16 @@ class Summarizer:
                     min_failures_to_reject=3,  # Require at least 3 failures to reject
                 )
 
+                item.to_be_summarized_hash = markdown_hash
+
                 if not item.to_be_summarized:
                     self.logger.info(f"Item {item.guid} is not worth summarizing")
                 else:
                     self.logger.info(f"Item {item.guid} marked for summarization")
 
-            # Update the database with our determination
-            self.state_manager.update_item(item, overwrite_flag)
+            # Record our determination in the database (unchanged if reused)
+            if not reuse_determination or item.is_paywall:
+                items_to_update[item.guid] = item
 
             # Skip items not worth summarizing
             if not item.to_be_summarized:
@@ -400,37 +700,106 @@ class Summarizer:
                 skipped_not_worth_summarizing += 1
                 continue
 
-            summarized = False
-
-            # Generate summaries based on requested types
-            if "standard" in summary_types:
-                if not has_standard_summary or overwrite_flag:
-                    self.logger.info(f"Generating standard summary for {item.guid}")
-                    item = self.summarize_item(item, summary_type="standard")
-                    if item.summary and item.summary_path:
-                        self.s3_storage.store_content(item.summary_path, item.summary)
-                        summarized = True
-
-            if "brief" in summary_types:
-                if not has_brief_summary or overwrite_flag:
-                    self.logger.info(f"Generating brief summary for {item.guid}")
-                    item = self.summarize_item(item, summary_type="brief")
-                    if item.short_summary and item.short_summary_path:
-                        self.s3_storage.store_content(
-                            item.short_summary_path, item.short_summary
-                        )
-                        summarized = True
+            # Queue the summary types this item still needs
+            for summary_type, has_summary in [
+                ("standard", has_standard_summary),
+                ("brief", has_brief_summary),
+            ]:
+                if summary_type in summary_types and (
+                    not has_summary or overwrite_flag
+                ):
+                    summary_jobs.append((item, summary_type))
+            items_to_generate.append(item)
+
+        # Syndicated articles often reach us from several feeds with the same body, so
+        # request one summary per distinct (article body, summary type)
+        jobs_by_content: Dict[Tuple[str, SummaryType], List[ContentItem]] = {}
+        for item, summary_type in summary_jobs:
+            key = (content_hash(markdown_body(item.markdown_content)), summary_type)
+            jobs_by_content.setdefault(key, []).append(item)
+        if len(jobs_by_content) < len(summary_jobs):
+            self.logger.info(
+                f"Requesting {len(jobs_by_content)} summaries for {len(summary_jobs)} "
+                "summary jobs (duplicate content shares a summary)"
+            )
 
-            # Update the item in DynamoDB only if we actually generated summaries
-            if summarized:
-                self.state_manager.update_item(item, overwrite_flag)
-                self.logger.info(
-                    f"Updated item '{item.title}' ({item.guid}): stored summaries"
-                )
-                items_successfully_summarized += 1
+        # Reuse summaries generated for the same article on earlier runs, unless
+        # overwriting (which asks for fresh summaries)
+        groups = list(jobs_by_content.items())
+        cache_keys = [
+            self._summary_cache_key(duplicates[0].markdown_content, summary_type)
+            for (_, summary_type), duplicates in groups
+        ]
+        cached_summaries = (
+            {} if overwrite_flag else self.s3_storage.get_contents(cache_keys)
+        )
+        summaries: List[Optional[str]] = [
+            cached_summaries.get(key) for key in cache_keys
+        ]
+        uncached = [i for i, summary in enumerate(summaries) if not summary]
+        if len(uncached) < len(summaries):
+            self.logger.info(
+                f"Reusing {len(summaries) - len(uncached)} cached summaries"
+            )
+
+        # Submit every remaining summary request as one LLM batch (the items and summary
+        # types are independent, and each request mostly waits on the LLM)
+        requests: List[Tuple[str, SummaryType]] = []
+        for i in uncached:
+            (_, summary_type), duplicates = groups[i]
+            requests.append((duplicates[0].markdown_content, summary_type))
+        new_summaries = self._summarize_batch(requests)
+
+        # Store the generated summaries (and cache entries for new ones) in S3 concurrently
+        summaries_to_store: Dict[str, Tuple[str, str]] = {}
+        new_cache_entries: Dict[str, str] = {}
+        for i, summary in zip(uncached, new_summaries):
+            summaries[i] = summary
+            if summary:
+                new_cache_entries[cache_keys[i]] = summary
+
+        for ((_, summary_type), duplicates), summary in zip(groups, summaries):
+            for item in duplicates:
+                self._apply_summary(item, summary, summary_type)
+                if summary:
+                    summary_path = (
+                        item.summary_path
+                        if summary_type == "standard"
+                        else item.short_summary_path
+                    )
+                    summaries_to_store[summary_path] = (item.guid, summary)
 
+        stored = self.s3_storage.store_contents(
+            {
+                **{path: summary for path, (_, summary) in summaries_to_store.items()},
+                **new_cache_entries,
+            }
+        )
+        summarized_guids = {
+            guid for path, (guid, _) in summaries_to_store.items() if stored.get(path)
+        }
+
+        for item in items_to_generate:
+            # Update the item in DynamoDB only if we actually generated summaries
+            if item.guid in summarized_guids:
+                items_to_update[item.guid] = item
             summarized_items.append(item)
 
+        # Write determinations and summary paths in one batch, one write per item
+        if self.state_manager.batch_update_items(
+            list(items_to_update.values()), overwrite_flag
+        ):
+            for item in items_to_generate:
+                if item.guid in summarized_guids:
+                    self.logger.info(
+                        f"Updated item '{item.title}' ({item.guid}): stored summaries"
+                    )
+                    items_successfully_summarized += 1
+        else:
+            self.logger.error(
+                f"Failed to update {len(items_to_update)} summarized items in DynamoDB"
+            )
+
         # Log summary stats
         total_skipped = (
             skipped_already_summarized
@@ -459,7 +828,8 @@ if __name__ == "__main__":
     with open(test_file, "r", encoding="utf-8") as f:
         content = f.read()
 
+    summaries = summarizer.summarize_text_multi(content)
     print("Standard summary:")
-    print(summarizer.summarize_text(content, summary_type="standard"))
+    print(summaries["standard"])
     print("\nBrief summary:")
-    print(summarizer.summarize_text(content, summary_type="brief"))
+    print(summaries["brief"])
@@ -11,6 +11,35 @@ from loguru import logger
 from src.content_curator.storage.dynamodb_state import DynamoDBState
 from src.content_curator.storage.s3_storage import S3Storage
 
+# Line separating the metadata header of processed markdown from the article body
+MARKDOWN_CONTENT_MARKER = "Markdown Content:\n"
+
+# Patterns used by the content quality checks, compiled once rather than per item
+MARKDOWN_LINK_RE = re.compile(r"\[.*?\]\(.*?\)")
+MARKDOWN_FORMATTING_RE = re.compile(r"[#*_`]")
+PUNCTUATION_RE = re.compile(r"[!?]")
+SENTENCE_END_RE = re.compile(r"[.!?]+")
+
+# Phrases suggesting content is behind a paywall or is only a teaser
+DEFAULT_PAYWALL_PATTERNS = [
+    r"subscribe now",
+    r"subscribe to continue",
+    r"subscribe for full access",
+    r"read more",
+    r"to continue reading",
+    r"sign up",
+    r"login to continue",
+    r"premium content",
+    r"become a member",
+    r"for subscribers only",
+    r"this content is available to subscribers",
+]
+# All default phrases as one alternation, so the sample is searched once rather than
+# once per phrase. The phrases are lowercase literals: match them against lowercased
+# text (IGNORECASE or capturing groups make the search several times slower), and the
+# matched text is the phrase itself
+_DEFAULT_PAYWALL_RE = re.compile("|".join(DEFAULT_PAYWALL_PATTERNS))
+
 
 def check_resources(resource: Union[DynamoDBState, S3Storage]) -> bool:
     """
@@ -57,6 +86,35 @@ def generate_url_hash(url: str) -> str:
     return short_hash
 
 
+def content_hash(content: str) -> str:
+    """
+    Generate a hash of some content, used to detect when derived values are stale.
+
+    Args:
+        content: The content to hash
+
+    Returns:
+        The hex-encoded SHA-256 digest of the content
+    """
+    return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+
+def markdown_body(markdown_content: str) -> str:
+    """
+    Get the article body of processed markdown, without the metadata header added by
+    MarkdownProcessor.format_content (dates, title and URL differ between feeds that
+    publish the same article).
+
+    Args:
+        markdown_content: The processed markdown content
+
+    Returns:
+        The content after the header, or the whole content if there is no header
+    """
+    _, marker, body = markdown_content.partition(MARKDOWN_CONTENT_MARKER)
+    return body if marker else markdown_content
+
+
 def generate_guid_for_rss_entry(entry, feed_url, title=None):
     """
     Generate a guid (globally unique identifier) for an RSS entry.
@@ -230,21 +288,12 @@ def _check_paywall_patterns(
     Returns:
         Tuple of (found_pattern: bool, matched_pattern: str)
     """
-    # Use default patterns if none provided
+    # Use the precompiled default patterns if none provided
     if paywall_patterns is None:
-        paywall_patterns = [
-            r"subscribe now",
-            r"subscribe to continue",
-            r"subscribe for full access",
-            r"read more",
-            r"to continue reading",
-            r"sign up",
-            r"login to continue",
-            r"premium content",
-            r"become a member",
-            r"for subscribers only",
-            r"this content is available to subscribers",
-        ]
+        match = _DEFAULT_PAYWALL_RE.search(sample_text.lower())
+        if match:
+            return True, match.group(0)
+        return False, ""
 
     # Check for paywall patterns
     for pattern in paywall_patterns:
@@ -253,6 +302,34 @@ def _check_paywall_patterns(
     return False, ""
 
 
+def _split_markdown_text(markdown_content: str) -> Tuple[str, str]:
+    """
+    Separate processed markdown into the parts the content quality checks look at.
+
+    Args:
+        markdown_content: The markdown content to check
+
+    Returns:
+        Tuple of (body without header metadata lines, plain text without links or formatting)
+    """
+    # Remove header metadata lines if present
+    content_lines = markdown_content.strip().split("\n")
+    content_body = "\n".join(
+        [
+            line
+            for line in content_lines
+            if not line.startswith("Date ")
+            and not line.startswith("Title:")
+            and not line.startswith("URL Source:")
+        ]
+    )
+
+    # Strip markdown and get pure text for length check
+    text_only = MARKDOWN_LINK_RE.sub("", content_body)  # Remove markdown links
+    text_only = MARKDOWN_FORMATTING_RE.sub("", text_only)  # Remove markdown formatting
+    return content_body, text_only.strip()
+
+
 def is_paywall_or_teaser(
     markdown_content: str,
     min_content_length: int = 100,
@@ -280,23 +357,26 @@ def is_paywall_or_teaser(
     Returns:
         True if content appears to be a teaser or behind a paywall
     """
-    # Remove header metadata lines if present
-    content_lines = markdown_content.strip().split("\n")
-    content_body = "\n".join(
-        [
-            line
-            for line in content_lines
-            if not line.startswith("Date ")
-            and not line.startswith("Title:")
-            and not line.startswith("URL Source:")
-        ]
+    content_body, clean_text = _split_markdown_text(markdown_content)
+    return _is_paywall_or_teaser(
+        content_body,
+        clean_text,
+        min_content_length,
+        paywall_patterns,
+        max_link_ratio,
+        min_failures_to_reject,
     )
 
-    # Strip markdown and get pure text for length check
-    text_only = re.sub(r"\[.*?\]\(.*?\)", "", content_body)  # Remove markdown links
-    text_only = re.sub(r"[#*_`]", "", text_only)  # Remove markdown formatting
-    clean_text = text_only.strip()
 
+def _is_paywall_or_teaser(
+    content_body: str,
+    clean_text: str,
+    min_content_length: int = 100,
+    paywall_patterns: List[str] = None,
+    max_link_ratio: float = 0.3,
+    min_failures_to_reject: int = 2,
+) -> bool:
+    """is_paywall_or_teaser on markdown already split by _split_markdown_text."""
     # Track failed checks
     failed_checks = 0
 
@@ -319,7 +399,7 @@ def is_paywall_or_teaser(
         failed_checks += 1
 
     # Check link ratio
-    link_ratio = len(re.findall(r"\[.*?\]\(.*?\)", content_body)) / max(
+    link_ratio = len(MARKDOWN_LINK_RE.findall(content_body)) / max(
         1, len(clean_text) / 100
     )
     if link_ratio > max_link_ratio:
@@ -360,28 +440,14 @@ def is_worth_summarizing(
     Returns:
         True if content is worth summarizing
     """
+    # Both checks look at the same text, so split the markdown once
+    content_body, clean_text = _split_markdown_text(markdown_content)
+
     # Skip paywall/teaser content - this is an automatic rejection
-    if is_paywall_or_teaser(markdown_content):
+    if _is_paywall_or_teaser(content_body, clean_text):
         logger.info("Content is behind paywall or just a teaser, skipping")
         return False
 
-    # Remove header metadata lines if present
-    content_lines = markdown_content.strip().split("\n")
-    content_body = "\n".join(
-        [
-            line
-            for line in content_lines
-            if not line.startswith("Date ")
-            and not line.startswith("Title:")
-            and not line.startswith("URL Source:")
-        ]
-    )
-
-    # Strip markdown and get pure text for length check
-    text_only = re.sub(r"\[.*?\]\(.*?\)", "", content_body)  # Remove markdown links
-    text_only = re.sub(r"[#*_`]", "", text_only)  # Remove markdown formatting
-    clean_text = text_only.strip()
-
     # Count failed checks
     failed_checks = 0
 
@@ -391,7 +457,7 @@ def is_worth_summarizing(
         failed_checks += 1
 
     # Check for excessive punctuation or unusual patterns
-    punct_count = len(re.findall(r"[!?]", clean_text))
+    punct_count = len(PUNCTUATION_RE.findall(clean_text))
     punct_ratio = punct_count / max(1, len(clean_text))
     if punct_ratio > max_punctuation_ratio:
         logger.info(
@@ -400,7 +466,7 @@ def is_worth_summarizing(
         failed_checks += 1
 
     # Count sentences as a rough proxy for article development
-    sentences = re.split(r"[.!?]+", clean_text)
+    sentences = SENTENCE_END_RE.split(clean_text)
     if len(sentences) < min_sentences:
         logger.info(
             f"Content has too few sentences: {len(sentences)} < {min_sentences}"
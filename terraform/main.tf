@@ -78,6 +78,25 @@ resource "aws_dynamodb_table" "content_metadata" {
     type = "S"
   }
 
+  # Lets the admin view list items with a Query instead of a Scan
+  # (enable with aws.dynamodb.admin_index_name in config.yaml)
+  attribute {
+    name = "admin_view_pk"
+    type = "S"
+  }
+
+  attribute {
+    name = "last_updated"
+    type = "S"
+  }
+
+  global_secondary_index {
+    name            = "admin-view-index"
+    hash_key        = "admin_view_pk"
+    range_key       = "last_updated"
+    projection_type = "ALL"
+  }
+
   tags = {
     Name        = "Content Curator Metadata"
     Environment = "Production"